@@ -0,0 +1,16 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Scripted Doodle Jump scenarios timed under SDL's dummy drivers
+                (run with: python -m benchmarks)
+"""
+
+import os, sys
+
+# No window or sound card is needed (set before pygame is imported)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# The game's modules and images are found from the top of the repository
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
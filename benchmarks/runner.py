@@ -0,0 +1,214 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Times the benchmark scenarios and compares them with the
+                stored baseline
+"""
+
+import argparse, json, os, sys, time, tracemalloc
+import pygame
+from benchmarks import ROOT
+from benchmarks.scenarios import SCENARIOS
+
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+# The baseline entry holding the reference work's speed on the machine that
+# recorded it
+REFERENCE = "reference"
+
+def createManager():
+    '''This function opens the (dummy) display and returns a SceneManager
+    with every scene built, as the game does at startup.'''
+    import doodleJumpAssets, doodleJumpScenes, doodleJumpScores, doodleJumpDisplay
+    pygame.init()
+    renderer = doodleJumpDisplay.Renderer()
+    # Benchmark games shouldn't fill up the score history or replays/
+    manager = doodleJumpScenes.SceneManager(renderer, doodleJumpAssets.ResourceBank(), \
+                                            doodleJumpScores.ScoreStore(":memory:"))
+    manager.scenes["play"].saveReplays = False
+    return manager
+
+def measureReference(rounds=50):
+    '''This function times a fixed amount of work that doesn't use the
+    game's code (Python arithmetic and pygame blits, like a frame) and
+    returns the rounds per second of the fastest of a few rounds, a measure
+    of how fast this machine is right now.'''
+    screen = pygame.Surface((401, 620))
+    image = pygame.Surface((60, 60))
+    image.fill((90, 200, 60))
+    fastest = None
+    for attempt in range(rounds):
+        startTime = time.perf_counter()
+        total = 0
+        for number in range(50000):
+            total += number * number % 7
+        for number in range(400):
+            screen.blit(image, (number % 341, number % 560))
+        elapsed = time.perf_counter() - startTime
+        if (fastest is None) or (elapsed < fastest):
+            fastest = elapsed
+    return round(1.0 / fastest, 1)
+
+def playFrames(manager, scenario, firstFrame, frames, traceMemory=False):
+    '''This function accepts the SceneManager, a started scenario, the first
+    frame number and the number of frames, and runs that many frames (one
+    simulation step each). When traceMemory is True it returns the average
+    peak memory (in bytes) allocated on top of what was in use at the start
+    of each frame.'''
+    allocated = 0
+    for frame in range(firstFrame, firstFrame + frames):
+        events = scenario.getEvents(manager, frame)
+        if traceMemory:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        manager.runFrame(events, 1)
+        if traceMemory:
+            allocated += tracemalloc.get_traced_memory()[1] - before
+    return allocated / float(frames)
+
+def runScenario(manager, scenarioClass, frames, warmup):
+    '''This function accepts the SceneManager, a scenario class, the number
+    of frames to time and the number of warm up frames. It returns a
+    dictionary of the scenario's frames per second, the memory allocated per
+    frame and the growth in allocated memory blocks per frame.'''
+    scenario = scenarioClass()
+    scenario.start(manager)
+    manager.applyPending()
+    playFrames(manager, scenario, 0, warmup)
+
+    # Frame rate (nothing traced, so nothing slows it down)
+    blocks = sys.getallocatedblocks()
+    startTime = time.perf_counter()
+    playFrames(manager, scenario, warmup, frames)
+    elapsed = time.perf_counter() - startTime
+    blockGrowth = (sys.getallocatedblocks() - blocks) / float(frames)
+
+    # Allocations (a shorter run, since tracing is slow)
+    tracemalloc.start()
+    allocated = playFrames(manager, scenario, warmup + frames, max(frames // 4, 1), True)
+    tracemalloc.stop()
+
+    return {"fps": round(frames / elapsed, 1), \
+            "allocKBPerFrame": round(allocated / 1024.0, 3), \
+            "blocksPerFrame": round(blockGrowth, 3)}
+
+def findSlowdowns(name, result, baseline, tolerance, speed=1.0):
+    '''This function accepts a scenario name, its result, the baseline
+    dictionary, the allowed fraction of change and how fast this machine is
+    compared with the one that recorded the baseline, and returns a list
+    with a message if the frame rate dropped by more than that.'''
+    expected = baseline.get(name)
+    if (expected is None) or (result["fps"] >= expected["fps"] * speed * (1 - tolerance)):
+        return []
+    return ["%s: %.0f fps, baseline %.0f on this machine" % (name, result["fps"], \
+            expected["fps"] * speed)]
+
+def findRegressions(name, result, baseline, tolerance):
+    '''This function accepts a scenario name, its result, the baseline
+    dictionary and the allowed fraction of change, and returns a list of
+    messages for every memory number that got worse by more than that
+    (these don't depend on the machine).'''
+    expected = baseline.get(name)
+    if expected is None:
+        return []
+    messages = []
+    # The memory numbers are small, so a little absolute slack is allowed too
+    if result["allocKBPerFrame"] > expected["allocKBPerFrame"] * (1 + tolerance) + 1.0:
+        messages.append("%s: %.1f KB allocated per frame, baseline %.1f" % (name, \
+                        result["allocKBPerFrame"], expected["allocKBPerFrame"]))
+    if result["blocksPerFrame"] > expected["blocksPerFrame"] * (1 + tolerance) + 0.5:
+        messages.append("%s: %.2f blocks kept per frame, baseline %.2f" % (name, \
+                        result["blocksPerFrame"], expected["blocksPerFrame"]))
+    return messages
+
+def main(arguments=None):
+    '''This function runs the scenarios, prints their numbers next to the
+    baseline and returns 1 if any of them regressed (frame rates only
+    warn with --no-fps-check).'''
+    names = [scenario.name for scenario in SCENARIOS]
+    epilog = "scenarios: " + "; ".join(scenario.name + " (" + scenario.description + ")" \
+                                       for scenario in SCENARIOS)
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", epilog=epilog, \
+                                     description="Time scripted Doodle Jump scenarios.")
+    parser.add_argument("--scenarios", nargs="+", default=names, choices=names)
+    parser.add_argument("--frames", type=int, default=900, help="frames timed per scenario")
+    parser.add_argument("--warmup", type=int, default=90, help="frames run before timing")
+    parser.add_argument("--tolerance", type=float, default=0.3, \
+                        help="allowed fraction of change before it counts as a regression")
+    parser.add_argument("--fps-tolerance", type=float, default=0.5, \
+                        help="allowed fraction of frame rate drop (after scaling to this " \
+                        "machine's speed) before it counts as a regression")
+    parser.add_argument("--no-fps-check", action="store_true", \
+                        help="only warn when a frame rate dropped (eg. on a busy machine)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", \
+                        help="store these results as the new baseline")
+    options = parser.parse_args(arguments)
+
+    # Image and font paths are relative to the top of the repository
+    os.chdir(ROOT)
+    baseline = {}
+    if os.path.isfile(options.baseline):
+        with open(options.baseline) as baselineFile:
+            baseline = json.load(baselineFile)
+
+    manager = createManager()
+    # Frame rates are compared relative to the reference work timed before
+    # and after the scenarios, since the baseline's were recorded on another
+    # machine (or the same one under a different load)
+    referenceBefore = measureReference()
+    results = {}
+    print("%-14s %9s %9s %11s %9s" % ("scenario", "fps", "baseline", "KB/frame", \
+                                      "blocks/f"))
+    for scenarioClass in SCENARIOS:
+        if scenarioClass.name not in options.scenarios:
+            continue
+        results[scenarioClass.name] = runScenario(manager, scenarioClass, options.frames, \
+                                                  options.warmup)
+    reference = round((referenceBefore + measureReference()) / 2.0, 1)
+    pygame.quit()
+
+    speed = 1.0
+    if REFERENCE in baseline:
+        speed = reference / baseline[REFERENCE]["roundsPerSecond"]
+    slowdowns = []
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name, {}).get("fps", 0) * speed
+        print("%-14s %9.0f %9.0f %11.1f %9.2f" % (name, result["fps"], expected, \
+              result["allocKBPerFrame"], result["blocksPerFrame"]))
+        slowdowns += findSlowdowns(name, result, baseline, options.fps_tolerance, speed)
+        regressions += findRegressions(name, result, baseline, options.tolerance)
+    print("")
+    if REFERENCE in baseline:
+        print("machine speed: %.2fx the baseline's (its frame rates are scaled to match)" % \
+              speed)
+    else:
+        print("the baseline has no reference speed, so its frame rates only mean " \
+              "something on the machine that recorded them (run with " \
+              "--update-baseline to record them here)")
+
+    if options.update_baseline:
+        # Scenarios that weren't run keep their frame rates, moved to this
+        # run's reference speed
+        for name, expected in baseline.items():
+            if (name != REFERENCE) and (name not in results):
+                expected["fps"] = round(expected["fps"] * speed, 1)
+        baseline.update(results)
+        baseline[REFERENCE] = {"roundsPerSecond": reference}
+        with open(options.baseline, "w") as baselineFile:
+            json.dump(baseline, baselineFile, indent=2, sort_keys=True)
+            baselineFile.write("\n")
+        print("baseline written to " + options.baseline)
+        return 0
+
+    # Frame rates swing with the machine's load even after scaling (hence
+    # their wider tolerance), so they can be made to only warn
+    if options.no_fps_check:
+        for message in slowdowns:
+            print("SLOWER      " + message)
+    else:
+        regressions += slowdowns
+    if regressions:
+        for message in regressions:
+            print("REGRESSION  " + message)
+        return 1
+    return 0
@@ -0,0 +1,151 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: The scripted scenarios played by the benchmarks
+"""
+
+import pygame, doodleJumpEngine, doodleJumpTournament
+
+def keyEvents(previous, inputs):
+    '''This function accepts the input bits held last frame and this frame
+    and returns the key events a player would have made.'''
+    events = []
+    for bit, key in ((doodleJumpEngine.INPUT_LEFT, pygame.K_LEFT), \
+                     (doodleJumpEngine.INPUT_RIGHT, pygame.K_RIGHT)):
+        if (inputs & bit) and not (previous & bit):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+        elif (previous & bit) and not (inputs & bit):
+            events.append(pygame.event.Event(pygame.KEYUP, key=key))
+    # Shooting happens once per key press
+    if inputs & doodleJumpEngine.INPUT_SHOOT:
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+    return events
+
+class Scenario(object):
+    '''A base class for a scripted scenario. It is started once and then asked
+    for the events of every frame.'''
+    name = ""
+    description = ""
+
+    def __init__(self, seed=1):
+        '''This initializer takes the seed of the first game played.'''
+        self.seed = seed
+
+    def start(self, manager):
+        '''This method accepts the SceneManager and switches to the scene the
+        scenario plays.'''
+
+    def getEvents(self, manager, frame):
+        '''This method accepts the SceneManager and the frame number and
+        returns the list of events for that frame.'''
+        return []
+
+class IdleMenu(Scenario):
+    '''The main menu with nobody touching it.'''
+    name = "idle-menu"
+    description = "main menu, no input"
+
+    def start(self, manager):
+        '''This method switches to the main menu.'''
+        manager.switchTo("mainMenu")
+
+class GameScenario(Scenario):
+    '''A base class for scenarios that play the game. A new game (with the
+    next seed) is started whenever one ends, so the game is always running.'''
+    def start(self, manager):
+        '''This method starts the first game.'''
+        self.games = 0
+        self.inputs = 0
+        manager.switchTo("play", seed=self.seed)
+
+    def getEvents(self, manager, frame):
+        '''This method starts another game if the last one ended and returns
+        the key events for the inputs the scenario picks.'''
+        scene = manager.stack[-1]
+        if scene is not manager.scenes["play"]:
+            self.games += 1
+            self.inputs = 0
+            manager.switchTo("play", seed=self.seed + self.games)
+            return []
+        inputs = self.getInputs(scene.state, frame)
+        events = keyEvents(self.inputs, inputs)
+        self.inputs = inputs & ~doodleJumpEngine.INPUT_SHOOT
+        return events
+
+    def getInputs(self, state, frame):
+        '''This method accepts the GameState and the frame number and returns
+        the input bits to hold (the climbing bot steers by default).'''
+        return doodleJumpTournament.climberPolicy(state, None)
+
+class SteadyClimb(GameScenario):
+    '''The climbing bot playing normally.'''
+    name = "climbing"
+    description = "bot steering from platform to platform"
+
+class SpringLaunch(GameScenario):
+    '''The Spring is put under the Doodle shortly after it starts falling,
+    so the screen keeps scrolling at spring speed.'''
+    name = "spring"
+    description = "repeated spring launches"
+
+    def getInputs(self, state, frame):
+        '''This method moves the Spring under a falling Doodle.'''
+        doodle = state.doodle
+        if doodle.getVelocity() > 5:
+            state.spring.rect.centerx = doodle.rect.centerx
+            state.spring.rect.top = doodle.rect.bottom - 1
+            state.spring.dirty = 1
+        return GameScenario.getInputs(self, state, frame)
+
+class MonsterKill(GameScenario):
+    '''A Monster is put above the Doodle and shot about once a second, so the
+    Poof animation keeps playing.'''
+    name = "monster-kill"
+    description = "monster shot every 25 frames (poof animation)"
+
+    def getInputs(self, state, frame):
+        '''This method moves the Monster into the line of fire and shoots.'''
+        inputs = GameScenario.getInputs(self, state, frame) & \
+                 ~doodleJumpEngine.INPUT_SHOOT
+        if (frame % 25 == 0) and not state.hitMonster:
+            doodle = state.doodle
+            monster = state.monster
+            # Lead the target, since it moves sideways while the bullet flies
+            monster.rect.centerx = doodle.rect.centerx - monster.dx * 8
+            monster.rect.centery = max(state.cameraY + 60, doodle.rect.top - 160)
+            inputs |= doodleJumpEngine.INPUT_SHOOT
+        return inputs
+
+class BulletSpam(GameScenario):
+    '''The climbing bot shooting on every frame.'''
+    name = "bullet-spam"
+    description = "bot shooting every frame"
+
+    def getInputs(self, state, frame):
+        '''This method adds a shot to every frame.'''
+        return GameScenario.getInputs(self, state, frame) | \
+               doodleJumpEngine.INPUT_SHOOT
+
+class BulletSwarm(GameScenario):
+    '''The climbing bot with rows of bullets flying up the whole screen, to
+    see how the game copes with hundreds of entities.'''
+    name = "swarm"
+    description = "10 extra bullets fired every frame (about 300 on screen)"
+
+    def getEvents(self, manager, frame):
+        '''This method fires a row of bullets from the bottom of the screen
+        on top of the climbing bot's inputs.'''
+        events = GameScenario.getEvents(self, manager, frame)
+        scene = manager.stack[-1]
+        if scene is manager.scenes["play"]:
+            state = scene.state
+            width = state.screen.get_width()
+            for shot in range(10):
+                bullet = state.bulletPool.acquire()
+                bullet.activate((frame * 7 + shot * width // 10) % width, \
+                                state.cameraY + state.screen.get_height())
+                state.bulletGroup.add(bullet)
+                scene.allSprites.add(bullet, layer=2)
+        return events
+
+# Scenarios in the order they are run
+SCENARIOS = (IdleMenu, SteadyClimb, SpringLaunch, MonsterKill, BulletSpam, BulletSwarm)
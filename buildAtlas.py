@@ -0,0 +1,80 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Offline texture atlas builder for the Doodle Jump game
+"""
+
+import pygame, os, json
+
+# Directories whose images get packed into the atlas
+ATLAS_DIRECTORIES = ("objects", "monsters", "poof", "buttons")
+ATLAS_WIDTH = 512
+# Empty pixels kept between images so they never bleed into each other
+PADDING = 1
+
+def collectImages(directories):
+    '''This function accepts a tuple of directories as a parameter and returns
+    a list of (name, surface) tuples for every PNG in them. The name is the
+    same relative path the sprites use to load the image.'''
+    images = []
+    for directory in directories:
+        for fileName in sorted(os.listdir(directory)):
+            if fileName.endswith(".png"):
+                name = directory + "/" + fileName
+                images.append((name, pygame.image.load(name)))
+    return images
+
+def packImages(images, width):
+    '''This function accepts a list of (name, surface) tuples and the atlas
+    width as parameters. It places the images in rows ("shelves"), tallest
+    first, and returns a dictionary of name -> [x, y, width, height] and the
+    total height needed.'''
+    # Packing the tallest images first keeps the rows tight
+    images = sorted(images, key=lambda image: image[1].get_height(), reverse=True)
+
+    index = {}
+    xCoordinate = PADDING
+    yCoordinate = PADDING
+    rowHeight = 0
+    for name, surface in images:
+        imageWidth, imageHeight = surface.get_size()
+        # Start a new row if the image doesn't fit in the current one
+        if xCoordinate + imageWidth + PADDING > width:
+            xCoordinate = PADDING
+            yCoordinate += rowHeight + PADDING
+            rowHeight = 0
+        index[name] = [xCoordinate, yCoordinate, imageWidth, imageHeight]
+        xCoordinate += imageWidth + PADDING
+        rowHeight = max(rowHeight, imageHeight)
+
+    return index, yCoordinate + rowHeight + PADDING
+
+def buildAtlas(outputDirectory="atlas", directories=ATLAS_DIRECTORIES, \
+               width=ATLAS_WIDTH):
+    '''This function packs every image in the given directories into one
+    atlas.png and writes its atlas.json index into the output directory. It
+    returns the index.'''
+    images = collectImages(directories)
+    index, height = packImages(images, width)
+
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+    for name, surface in images:
+        # BLEND_RGBA_MAX onto a transparent sheet copies the pixels (alpha
+        # included) exactly instead of alpha blending them
+        sheet.blit(surface, index[name][:2], special_flags=pygame.BLEND_RGBA_MAX)
+
+    if not os.path.isdir(outputDirectory):
+        os.makedirs(outputDirectory)
+    pygame.image.save(sheet, os.path.join(outputDirectory, "atlas.png"))
+    with open(os.path.join(outputDirectory, "atlas.json"), "w") as indexFile:
+        json.dump({"image": "atlas.png", "size": [width, height], \
+                   "frames": index}, indexFile, sort_keys=True)
+    return index
+
+def main():
+    '''This function builds the atlas from the game's image directories.'''
+    index = buildAtlas()
+    print("Packed " + str(len(index)) + " images into atlas/atlas.png")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,658 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Shared asset cache for the Doodle Jump game
+"""
+
+import pygame, os, json, time, collections, concurrent.futures, hashlib, mmap, struct
+
+# Where the decoded, display-format pixels of the images are kept between runs
+PIXEL_CACHE_PATH = os.path.join("cache", "pixels.bin")
+PIXEL_CACHE_MAGIC = b"DJPX"
+PIXEL_CACHE_VERSION = 1
+# Magic, version and length of the JSON index that follows
+PIXEL_CACHE_HEADER = struct.Struct("<4sII")
+# Each image's pixels start on a multiple of this many bytes
+PIXEL_CACHE_ALIGNMENT = 64
+
+class TextureAtlas(object):
+    '''A class to hand out named subsurface views of one packed atlas image.'''
+    def __init__(self, indexPath):
+        '''This initializer takes the path of an atlas index file (written by
+        buildAtlas.py) as a parameter and reads the frame rectangles.'''
+        with open(indexPath) as indexFile:
+            index = json.load(indexFile)
+        self.imagePath = os.path.join(os.path.dirname(indexPath), index["image"])
+        self.frames = index["frames"]
+        # The atlas image itself is decoded lazily, once per conversion mode
+        self.sheets = {}
+
+    def __contains__(self, name):
+        '''This method returns True if the named image is packed in the atlas.'''
+        return name in self.frames
+
+    def getSheet(self, mode):
+        '''This method accepts a conversion mode ("alpha" or "none") as a
+        parameter and returns the whole atlas surface, decoding it only once.'''
+        sheet = self.sheets.get(mode)
+        if sheet is None:
+            sheet = convertImage(self.imagePath, mode)
+            self.sheets[mode] = sheet
+        return sheet
+
+    def getImage(self, name, mode="alpha"):
+        '''This method accepts an image name (eg. "objects/green.png") and a
+        conversion mode as parameters. It returns a subsurface view that
+        shares its pixels with the atlas.'''
+        return self.getSheet(mode).subsurface(pygame.Rect(self.frames[name]))
+
+def loadAtlas(indexPath="atlas/atlas.json"):
+    '''This function accepts the path of an atlas index file as a parameter
+    and returns the TextureAtlas, or None if no atlas has been built.'''
+    if not os.path.isfile(indexPath):
+        return None
+    return TextureAtlas(indexPath)
+
+class Preloader(object):
+    '''A class that decodes image and sound files on a pool of threads, in
+    the order they are queued, so they are ready (or nearly) by the time a
+    screen asks for them. Only the decoding happens on the threads: images
+    are converted for the display when they are taken.'''
+    def __init__(self, workers=4):
+        '''This initializer takes the number of decoding threads.'''
+        self.executor = concurrent.futures.ThreadPoolExecutor(workers, \
+                                                              thread_name_prefix="preload")
+        self.futures = {}
+        self.queued = 0
+        # Time the main thread spent waiting for files that weren't ready
+        self.waitTime = 0.0
+
+    def queue(self, path):
+        '''This method accepts the path of an image or sound file and starts
+        decoding it (unless it was already queued).'''
+        if path in self.futures:
+            return
+        if path.endswith(".ogg") or path.endswith(".wav"):
+            decode = pygame.mixer.Sound
+        else:
+            decode = pygame.image.load
+        self.futures[path] = self.executor.submit(decode, path)
+        self.queued += 1
+
+    def take(self, path):
+        '''This method accepts a file path and returns its decoded surface or
+        Sound (waiting for it if it isn't ready yet), or None if it was never
+        queued. Each file is handed out once.'''
+        future = self.futures.pop(path, None)
+        if future is None:
+            return None
+        if not future.done():
+            startTime = time.perf_counter()
+            concurrent.futures.wait((future,))
+            self.waitTime += time.perf_counter() - startTime
+        return future.result()
+
+    def waitFor(self, paths, timeout=None):
+        '''This method accepts a list of file paths and the most seconds to
+        wait, and returns True once every one of them that is still queued
+        has been decoded (or False if the time ran out first).'''
+        futures = [self.futures[path] for path in paths if path in self.futures]
+        return not concurrent.futures.wait(futures, timeout).not_done
+
+    def getProgress(self):
+        '''This accessor returns a tuple (files decoded, files queued).'''
+        pending = sum(1 for future in self.futures.values() if not future.done())
+        return self.queued - pending, self.queued
+
+    def shutdown(self):
+        '''This method stops decoding files nobody asked for yet.'''
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+def getDisplayFormat():
+    '''This function returns the bits per pixel and color masks of the
+    display as a list (what surfaces are converted to).'''
+    display = pygame.display.get_surface()
+    return [display.get_bitsize()] + list(display.get_masks())
+
+def getFileHash(path):
+    '''This function accepts a file path and returns the SHA-1 of its
+    contents as a hex string.'''
+    digest = hashlib.sha1()
+    with open(path, "rb") as sourceFile:
+        for block in iter(lambda: sourceFile.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class PixelCache(object):
+    '''A class that keeps images already decoded and converted for the
+    display in one file, which is memory-mapped when the game starts. An
+    image is then a surface built straight on the mapped pixels (no PNG
+    decoding and no copy) instead of a decode and a conversion.
+
+    The file holds a JSON index (the display format, and each image's source
+    file, conversion mode, size, modification time, size on disk, SHA-1 and
+    offset) followed by the BGRA pixels of each image. An image is only used
+    while its source file is unchanged: a different modification time sends
+    it to the SHA-1, so touching a file costs a hash but editing it drops
+    the image. The file is written again by save() when images were added
+    or dropped.'''
+    def __init__(self, path=PIXEL_CACHE_PATH):
+        '''This initializer takes the path of the cache file and maps it (if
+        it exists and was written for this display format). The display mode
+        must already be set.'''
+        self.path = path
+        self.displayFormat = getDisplayFormat()
+        # Index entries keyed by (source path, conversion mode)
+        self.entries = {}
+        # Entries whose source file has been checked this run
+        self.checked = set()
+        # Surfaces decoded this run that the file doesn't have yet
+        self.added = {}
+        self.buffer = None
+        self.dataStart = 0
+        self.hits = 0
+        self.stale = 0
+        self.changed = False
+        self.open()
+
+    def open(self):
+        '''This method maps the cache file and reads its index, leaving the
+        cache empty if the file is missing, damaged or for another display.'''
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, "rb") as cacheFile:
+            try:
+                # Pages are only read when an image uses them, and written
+                # pixels stay private to this process
+                buffer = mmap.mmap(cacheFile.fileno(), 0, access=mmap.ACCESS_COPY)
+            except (OSError, ValueError):
+                self.changed = True
+                return
+        try:
+            magic, version, length = PIXEL_CACHE_HEADER.unpack_from(buffer)
+            index = json.loads(buffer[PIXEL_CACHE_HEADER.size:PIXEL_CACHE_HEADER.size + \
+                                      length].decode("utf-8"))
+        except (struct.error, ValueError):
+            magic = None
+        if (magic != PIXEL_CACHE_MAGIC) or (version != PIXEL_CACHE_VERSION) or \
+           (index.get("display") != self.displayFormat):
+            buffer.close()
+            self.changed = True
+            return
+        self.buffer = buffer
+        self.dataStart = alignOffset(PIXEL_CACHE_HEADER.size + length)
+        for entry in index["entries"]:
+            self.entries[(entry["path"], entry["mode"])] = entry
+
+    def isFresh(self, key):
+        '''This method accepts a (source path, conversion mode) key and
+        returns True if the cache has that image and its source file hasn't
+        changed since. Images whose source changed are dropped.'''
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        if key in self.checked:
+            return True
+        try:
+            status = os.stat(entry["path"])
+            fresh = (status.st_mtime_ns == entry["mtime"]) and \
+                    (status.st_size == entry["size"])
+            if (not fresh) and (status.st_size == entry["size"]):
+                # Touched (eg. checked out again) but maybe not edited
+                fresh = getFileHash(entry["path"]) == entry["hash"]
+                entry["mtime"] = status.st_mtime_ns
+                self.changed = True
+        except OSError:
+            fresh = False
+        if not fresh:
+            del self.entries[key]
+            self.stale += 1
+            self.changed = True
+            return False
+        self.checked.add(key)
+        return True
+
+    def has(self, path):
+        '''This method accepts a source path and returns True if the cache
+        has an up to date image of it in any conversion mode.'''
+        return any(self.isFresh(key) for key in list(self.entries) if key[0] == path)
+
+    def get(self, path, mode):
+        '''This method accepts a source path and a conversion mode ("alpha"
+        or "opaque") and returns the cached surface, or None if the cache
+        doesn't have an up to date one.'''
+        if not self.isFresh((path, mode)):
+            return None
+        entry = self.entries[(path, mode)]
+        size = (entry["width"], entry["height"])
+        start = self.dataStart + entry["offset"]
+        pixels = memoryview(self.buffer)[start:start + size[0] * size[1] * 4]
+        # The surface uses the mapped pixels as they are
+        surface = pygame.image.frombuffer(pixels, size, "BGRA")
+        # The display's opaque format has no alpha byte, so those images are
+        # copied into it (still much cheaper than decoding them)
+        if mode == "opaque":
+            surface = surface.convert()
+        elif list(surface.get_masks()) != entry["masks"]:
+            surface = surface.convert_alpha()
+        self.hits += 1
+        return surface
+
+    def add(self, path, mode, surface):
+        '''This method accepts a source path, a conversion mode and the
+        converted surface, to be written to the file by save().'''
+        self.added[(path, mode)] = surface
+        self.changed = True
+
+    def save(self):
+        '''This method writes the cache file again (if anything was added
+        or dropped) with every up to date image, and returns True if it was
+        written.'''
+        if not self.changed:
+            return False
+        images = []
+        for key, entry in self.entries.items():
+            if key not in self.added:
+                start = self.dataStart + entry["offset"]
+                entry = dict(entry)
+                images.append((entry, self.buffer[start:start + entry["width"] * \
+                                                  entry["height"] * 4]))
+        for (path, mode), surface in self.added.items():
+            try:
+                status = os.stat(path)
+                fileHash = getFileHash(path)
+            except OSError:
+                continue
+            entry = {"path": path, "mode": mode, "width": surface.get_width(), \
+                     "height": surface.get_height(), "masks": list(surface.get_masks()), \
+                     "mtime": status.st_mtime_ns, "size": status.st_size, "hash": fileHash}
+            images.append((entry, pygame.image.tobytes(surface, "BGRA")))
+
+        offset = 0
+        for entry, pixels in images:
+            entry["offset"] = offset
+            offset = alignOffset(offset + len(pixels))
+        index = json.dumps({"display": self.displayFormat, \
+                            "entries": [entry for entry, pixels in images]}, \
+                           sort_keys=True).encode("utf-8")
+        dataStart = alignOffset(PIXEL_CACHE_HEADER.size + len(index))
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            # Written next to the old file and swapped in, since the old one
+            # is still mapped
+            with open(self.path + ".tmp", "wb") as cacheFile:
+                cacheFile.write(PIXEL_CACHE_HEADER.pack(PIXEL_CACHE_MAGIC, \
+                                                        PIXEL_CACHE_VERSION, len(index)))
+                cacheFile.write(index)
+                for entry, pixels in images:
+                    cacheFile.seek(dataStart + entry["offset"])
+                    cacheFile.write(pixels)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError:
+            # (eg. Windows won't replace a file that is mapped)
+            return False
+        self.changed = False
+        return True
+
+    def getStats(self):
+        '''This accessor returns a dictionary with the number of cached
+        images, the images served from the cache and the images dropped
+        because their source changed.'''
+        return {"pixelImages": len(self.entries), "pixelHits": self.hits, \
+                "pixelStale": self.stale}
+
+def alignOffset(offset):
+    '''This function accepts a byte offset and returns it rounded up to the
+    pixel cache's alignment.'''
+    return -(-offset // PIXEL_CACHE_ALIGNMENT) * PIXEL_CACHE_ALIGNMENT
+
+class ImageCache(object):
+    '''A class to load every image once and hand out shared, already
+    converted surfaces.'''
+    def __init__(self, atlas=None):
+        '''This initializer takes an optional TextureAtlas as a parameter and
+        sets up the empty cache and the hit/miss counters.'''
+        # Surfaces are keyed by (path, conversion mode)
+        self.surfaces = {}
+        # Images packed in the atlas are served as views of it instead
+        # of being decoded from their own files
+        self.atlas = atlas
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path, mode="alpha"):
+        '''This method accepts an image path and a conversion mode ("alpha",
+        "opaque" or "none") as parameters. It returns the shared surface for
+        that image, loading and converting it only the first time.'''
+        # Surfaces can only be converted once a display mode has been set,
+        # so without a window (headless simulation) images are kept as is
+        if pygame.display.get_surface() is None:
+            mode = "none"
+
+        key = (path, mode)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if (self.atlas is not None) and (mode != "opaque") and (path in self.atlas):
+            surface = self.atlas.getImage(path, mode)
+            self.surfaces[key] = surface
+            return surface
+
+        surface = convertImage(path, mode)
+        self.surfaces[key] = surface
+        return surface
+
+    def getStats(self):
+        '''This accessor returns a dictionary with the number of cached
+        surfaces, cache hits and cache misses.'''
+        return {"surfaces": len(self.surfaces), "hits": self.hits, \
+                "misses": self.misses}
+
+    def clear(self):
+        '''This method empties the cache (eg. after the display mode changes)
+        and resets the counters.'''
+        self.surfaces.clear()
+        if self.atlas is not None:
+            self.atlas.sheets.clear()
+        self.hits = 0
+        self.misses = 0
+
+class MaskCache(object):
+    '''A class to build the collision mask of each distinct image only once.'''
+    def __init__(self):
+        '''This initializer sets up the empty cache and the build counters.'''
+        # Masks are keyed by the (shared) surface they were built from
+        self.masks = {}
+        self.built = 0
+        # Used to work out how many masks were built per second
+        self.lastBuilt = 0
+        self.lastTime = time.perf_counter()
+
+    def getMask(self, surface):
+        '''This method accepts a surface as a parameter and returns its
+        collision mask, building it the first time the surface is seen.'''
+        mask = self.masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self.masks[surface] = mask
+            self.built += 1
+        return mask
+
+    def getBuildRate(self):
+        '''This method returns the number of masks built per second since the
+        last time it was called (0 once every image has its mask).'''
+        now = time.perf_counter()
+        rate = (self.built - self.lastBuilt) / max(now - self.lastTime, 1e-6)
+        self.lastBuilt = self.built
+        self.lastTime = now
+        return rate
+
+class TextCache(object):
+    '''A class that opens each (font file, size) once and keeps the text
+    rendered with it, so labels are only rasterized the first time they're
+    drawn.'''
+    def __init__(self, maxStrings=256):
+        '''This initializer takes the number of rendered strings to keep
+        (the least recently used ones are dropped first).'''
+        self.fonts = {}
+        self.strings = collections.OrderedDict()
+        self.maxStrings = maxStrings
+        # Single characters (eg. score digits), which are never dropped
+        self.glyphs = {}
+        self.hits = 0
+        self.misses = 0
+
+    def getFont(self, path, size):
+        '''This method accepts a font file and point size as parameters and
+        returns the shared pygame Font.'''
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, path, size, text, color=(0, 0, 0)):
+        '''This method accepts a font file, point size, string and color and
+        returns the shared antialiased surface of that text.'''
+        key = (path, size, text, color)
+        surface = self.strings.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = self.getFont(path, size).render(text, 1, color)
+            self.strings[key] = surface
+            if len(self.strings) > self.maxStrings:
+                self.strings.popitem(last=False)
+        else:
+            self.hits += 1
+            self.strings.move_to_end(key)
+        return surface
+
+    def getGlyph(self, path, size, character, color):
+        '''This method accepts a font file, point size, single character and
+        color and returns the shared surface of that character.'''
+        key = (path, size, character, color)
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            glyph = self.getFont(path, size).render(character, 1, color)
+            self.glyphs[key] = glyph
+        return glyph
+
+    def renderNumber(self, path, size, prefix, number, color=(0, 0, 0)):
+        '''This method accepts a font file, point size, label prefix (eg.
+        "score: "), integer and color and returns a new surface of the label
+        put together from the cached prefix and digit glyphs (instead of
+        rasterizing the whole string again).'''
+        pieces = [self.getGlyph(path, size, digit, color) for digit in str(number)]
+        if prefix:
+            pieces.insert(0, self.render(path, size, prefix, color))
+        height = max(piece.get_height() for piece in pieces)
+        surface = pygame.Surface((sum(piece.get_width() for piece in pieces), height), \
+                                 pygame.SRCALPHA)
+        xCoordinate = 0
+        for piece in pieces:
+            # Copy the pixels as they are (they don't overlap)
+            surface.blit(piece, (xCoordinate, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            xCoordinate += piece.get_width()
+        return surface
+
+    def getStats(self):
+        '''This method returns a dictionary of the string hit/miss counters
+        and the number of glyphs cached.'''
+        return {"textHits": self.hits, "textMisses": self.misses, \
+                "glyphs": len(self.glyphs)}
+
+# The process-wide caches shared by every sprite and screen
+imageCache = ImageCache(loadAtlas())
+maskCache = MaskCache()
+textCache = TextCache()
+
+# Decodes files ahead of time once startPreloading() is called
+preloader = None
+# Serves images already decoded in earlier runs once openPixelCache() is called
+pixelCache = None
+
+def decodeImage(path):
+    '''This function accepts an image path and returns the decoded (not yet
+    converted) surface, from the preloader when it was queued there.'''
+    if preloader is not None:
+        surface = preloader.take(path)
+        if surface is not None:
+            return surface
+    return pygame.image.load(path)
+
+def convertImage(path, mode):
+    '''This function accepts an image path and a conversion mode ("alpha",
+    "opaque" or "none") and returns a new surface of it converted that way,
+    from the pixel cache when it has the image.'''
+    cached = (pixelCache is not None) and (mode != "none")
+    if cached:
+        surface = pixelCache.get(path, mode)
+        if surface is not None:
+            return surface
+    surface = decodeImage(path)
+    if mode == "alpha":
+        surface = surface.convert_alpha()
+    elif mode == "opaque":
+        surface = surface.convert()
+    if cached:
+        pixelCache.add(path, mode, surface)
+    return surface
+
+def decodeSound(path):
+    '''This function accepts a sound path and returns the decoded Sound,
+    from the preloader when it was queued there.'''
+    if preloader is not None:
+        sound = preloader.take(path)
+        if sound is not None:
+            return sound
+    return pygame.mixer.Sound(path)
+
+def loadImage(path, mode="alpha"):
+    '''This function accepts an image path and conversion mode as parameters
+    and returns the shared surface from the process-wide image cache.'''
+    return imageCache.load(path, mode)
+
+def getMask(surface):
+    '''This function accepts a surface as a parameter and returns its shared
+    collision mask from the process-wide mask cache.'''
+    return maskCache.getMask(surface)
+
+def getFont(path, size):
+    '''This function accepts a font file and point size as parameters and
+    returns the shared Font from the process-wide text cache.'''
+    return textCache.getFont(path, size)
+
+def renderText(path, size, text, color=(0, 0, 0)):
+    '''This function accepts a font file, point size, string and color as
+    parameters and returns the shared rendered text surface.'''
+    return textCache.render(path, size, text, color)
+
+def renderNumber(path, size, prefix, number, color=(0, 0, 0)):
+    '''This function accepts a font file, point size, label prefix, integer
+    and color as parameters and returns a label built from cached glyphs.'''
+    return textCache.renderNumber(path, size, prefix, number, color)
+
+def getCacheStats():
+    '''This function returns the hit/miss counters of the process-wide image
+    and text caches and the number of collision masks built.'''
+    stats = imageCache.getStats()
+    stats["masksBuilt"] = maskCache.built
+    stats.update(textCache.getStats())
+    if pixelCache is not None:
+        stats.update(pixelCache.getStats())
+    return stats
+
+class ResourceBank(object):
+    '''A class that loads the backgrounds and sounds of every screen once so
+    they can be shared for the rest of the game.'''
+    # Background images (and their translucency, if any)
+    backgroundFiles = {"mainMenu": ("backgrounds/main_menu.png", None), \
+                       "gameOver": ("backgrounds/game_over.png", None), \
+                       "paused": ("backgrounds/paused.png", 220), \
+                       "game": ("backgrounds/background.png", None)}
+    # Sound effects and their volumes
+    soundFiles = {"boing": ("sounds/boing.ogg", 1.0), \
+                  "shoot": ("sounds/shoot.ogg", 0.7), \
+                  "falling": ("sounds/falling.ogg", 0.5), \
+                  "breaking": ("sounds/breaking.ogg", 0.6), \
+                  "poof": ("sounds/poof.ogg", 0.6), \
+                  "dizzy": ("sounds/dizzy.ogg", 0.7), \
+                  "click": ("sounds/click.ogg", 1.0), \
+                  "growl": ("sounds/growl.ogg", 0.3), \
+                  "boing2": ("sounds/boing2.ogg", 0.6)}
+    musicFile = "sounds/music.ogg"
+    
+    def __init__(self):
+        '''This initializer sets up the empty bank. Each background and sound
+        is loaded (from the preloader, if it is running) the first time a
+        screen asks for it, so a screen only waits for its own files. The
+        display mode must already be set.'''
+        self.backgrounds = {}
+        self.sounds = {}
+            
+    def getBackground(self, name):
+        '''This accessor returns the shared background surface with the given
+        name, loading (and converting) it the first time.'''
+        background = self.backgrounds.get(name)
+        if background is None:
+            path, alpha = self.backgroundFiles[name]
+            background = loadImage(path, "opaque")
+            if alpha is not None:
+                # The shared surface is only ever used translucent
+                background.set_alpha(alpha)
+            self.backgrounds[name] = background
+        return background
+        
+    def getSound(self, name):
+        '''This accessor returns the shared Sound with the given name,
+        decoding it the first time.'''
+        sound = self.sounds.get(name)
+        if sound is None:
+            path, volume = self.soundFiles[name]
+            sound = decodeSound(path)
+            sound.set_volume(volume)
+            self.sounds[name] = sound
+        return sound
+
+    def loadSounds(self):
+        '''This method decodes every sound effect not loaded yet (eg. before
+        a game starts) and returns the dictionary of them.'''
+        for name in self.soundFiles:
+            self.getSound(name)
+        return self.sounds
+        
+    def playMusic(self):
+        '''This method starts the background music, unless it is already
+        playing (so it keeps streaming across screens).'''
+        if not pygame.mixer.music.get_busy():
+            pygame.mixer.music.load(self.musicFile)
+            pygame.mixer.music.set_volume(0.1)
+            pygame.mixer.music.play(-1)
+
+def getStartupFiles():
+    '''This function returns the files the main menu needs before it is
+    shown: its background, the click sound and the atlas the sprites are
+    cut from.'''
+    paths = [ResourceBank.backgroundFiles["mainMenu"][0], ResourceBank.soundFiles["click"][0]]
+    if imageCache.atlas is not None:
+        paths.append(imageCache.atlas.imagePath)
+    return paths
+
+def startPreloading(workers=None):
+    '''This function accepts the number of decoding threads (one per
+    processor, up to 4, by default) and starts
+    decoding every background, sound effect and the atlas in the background,
+    the main menu's files first. It returns the Preloader.'''
+    global preloader
+    if workers is None:
+        # Extra threads only slow the main thread down on a single processor
+        workers = min(4, os.cpu_count() or 1)
+    preloader = Preloader(workers)
+    paths = getStartupFiles() + \
+            [path for path, alpha in ResourceBank.backgroundFiles.values()] + \
+            [path for path, volume in ResourceBank.soundFiles.values()]
+    for path in paths:
+        # Images the pixel cache already has don't need decoding at all
+        if (pixelCache is None) or not pixelCache.has(path):
+            preloader.queue(path)
+    return preloader
+
+def openPixelCache(path=PIXEL_CACHE_PATH):
+    '''This function accepts the path of the pixel cache file and maps it
+    for every image loaded after this (the display mode must already be
+    set). It returns the PixelCache.'''
+    global pixelCache
+    pixelCache = PixelCache(path)
+    return pixelCache
+
+def savePixelCache():
+    '''This function writes the pixel cache file again if images were
+    added to it or dropped from it, and returns True if it was written.'''
+    if pixelCache is None:
+        return False
+    return pixelCache.save()
@@ -0,0 +1,127 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Plays the Doodle Jump sound effects through a voice manager
+                that limits how many of each can play and how often
+"""
+
+import pygame, collections, time
+
+# Each sound effect's settings: the most copies of it playing at once, the
+# least time (in milliseconds) between two of them, and whether it loops
+# while the game keeps asking for it (and how long it fades out after)
+VOICES = {"boing": {"channels": 2, "cooldown": 60}, \
+          "boing2": {"channels": 1, "cooldown": 120}, \
+          "breaking": {"channels": 1, "cooldown": 60}, \
+          "shoot": {"channels": 2, "cooldown": 50}, \
+          "poof": {"channels": 1, "cooldown": 100}, \
+          "dizzy": {"channels": 1, "cooldown": 500}, \
+          "falling": {"channels": 1, "cooldown": 1000}, \
+          "click": {"channels": 1, "cooldown": 50}, \
+          "growl": {"channels": 1, "cooldown": 0, "loop": True, "fadeout": 300}}
+
+class VoiceManager(object):
+    '''A class that plays the sounds of a ResourceBank through a fixed
+    budget of mixer channels.
+
+    A one-shot sound (eg. boing) is skipped when it was played less than its
+    cooldown ago or when its channels are all still playing it, so a burst
+    of the same event costs one mixer call. A looping sound (the growl) is
+    held: the game asks for it on every step it should be heard, the loop
+    starts the first time and fades out after the first step that doesn't
+    ask for it, so nothing is played or stopped while it keeps going.
+
+    Every call into the mixer is counted, so the mixer calls per second can
+    be watched while playing.'''
+    def __init__(self, bank, voices=VOICES, clock=pygame.time.get_ticks):
+        '''This initializer takes the ResourceBank, a dictionary of each
+        sound's settings and a function returning the time in milliseconds.
+        It gives the mixer exactly the channels the sounds' budgets add up
+        to.'''
+        self.bank = bank
+        self.voices = voices
+        self.clock = clock
+        # When each sound was last played, and when each copy of it still
+        # playing will end (worked out from its length, not asked of the mixer)
+        self.lastPlayed = {}
+        self.endTimes = dict((name, collections.deque()) for name in voices)
+        # The loops playing, and the ones asked for during this step
+        self.looping = set()
+        self.held = set()
+        self.lengths = {}
+        self.calls = 0
+        self.skipped = 0
+        # Used to work out the mixer calls per second
+        self.lastCalls = 0
+        self.lastTime = time.perf_counter()
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(sum(voice["channels"] for voice in voices.values()))
+
+    def getLength(self, name):
+        '''This method accepts a sound name and returns its length in
+        milliseconds (asking the mixer only once).'''
+        length = self.lengths.get(name)
+        if length is None:
+            length = int(self.bank.getSound(name).get_length() * 1000)
+            self.lengths[name] = length
+        return length
+
+    def trigger(self, name):
+        '''This method accepts a sound name and plays it, or holds it for
+        this step if it loops.'''
+        voice = self.voices[name]
+        if voice.get("loop"):
+            self.held.add(name)
+            if name not in self.looping:
+                self.bank.getSound(name).play(-1)
+                self.calls += 1
+                self.looping.add(name)
+            return
+
+        now = self.clock()
+        if now - self.lastPlayed.get(name, -voice["cooldown"]) < voice["cooldown"]:
+            self.skipped += 1
+            return
+        endTimes = self.endTimes[name]
+        while endTimes and (endTimes[0] <= now):
+            endTimes.popleft()
+        if len(endTimes) >= voice["channels"]:
+            self.skipped += 1
+            return
+        self.bank.getSound(name).play()
+        self.calls += 1
+        self.lastPlayed[name] = now
+        endTimes.append(now + self.getLength(name))
+
+    def endStep(self):
+        '''This method fades out the loops nobody asked for during the step
+        that just ended.'''
+        for name in self.looping - self.held:
+            self.bank.getSound(name).fadeout(self.voices[name].get("fadeout", 0))
+            self.calls += 1
+            self.looping.discard(name)
+        self.held.clear()
+
+    def stopLoops(self):
+        '''This method stops every loop at once (eg. when the game is paused
+        or over).'''
+        for name in self.looping:
+            self.bank.getSound(name).stop()
+            self.calls += 1
+        self.looping.clear()
+        self.held.clear()
+
+    def getCallRate(self):
+        '''This method returns the number of mixer calls per second since
+        the last time it was called.'''
+        now = time.perf_counter()
+        rate = (self.calls - self.lastCalls) / max(now - self.lastTime, 1e-6)
+        self.lastCalls = self.calls
+        self.lastTime = now
+        return rate
+
+    def getStats(self):
+        '''This accessor returns a dictionary with the number of mixer calls,
+        the sounds skipped by their cooldown or channel budget and the loops
+        playing.'''
+        return {"calls": self.calls, "skipped": self.skipped, \
+                "looping": len(self.looping)}
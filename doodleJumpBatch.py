@@ -0,0 +1,336 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: NumPy batch simulator running many Doodle Jump games in lockstep
+"""
+
+import numpy, pygame, doodleJumpAssets, doodleJumpSprites
+from doodleJumpEngine import SCREEN_WIDTH, SCREEN_HEIGHT, INPUT_LEFT, \
+     INPUT_RIGHT, INPUT_SHOOT
+
+# Platform types stored in BatchSimulator.platformType
+GREEN = 0
+BLUE = 1
+BROWN = 2
+
+# Causes of death stored in BatchSimulator.causeOfDeath
+ALIVE = 0
+FELL = 1
+MONSTER = 2
+
+NUM_PLATFORMS = 25
+# Bullets in flight per game (a bullet lives at most ~30 frames)
+NUM_BULLETS = 8
+
+def imageSize(path):
+    '''This function accepts an image path as a parameter and returns its
+    (width, height), which is the size of the rect of the sprite using it.'''
+    return doodleJumpAssets.loadImage(path, "none").get_size()
+
+class BatchSimulator(object):
+    '''A class that stores N games of Doodle Jump as NumPy arrays and advances
+    all of them with one vectorized step.
+
+    It models the rules GameState had when this simulator was written (a
+    fixed set of 25 platforms per game, every 7th blue and every other 4th
+    brown, moved back up when they scroll off, with rects moved on every
+    scroll), with collisions tested between rects instead of pixel masks. It
+    doesn't follow the level generator, its platform weights, world
+    coordinates or random number streams, so a seed doesn't play the same
+    game as doodleJumpEngine.GameState; it is meant for statistics over
+    many games.'''
+    def __init__(self, numGames, seed=None):
+        '''This initializer takes the number of games and an optional seed as
+        parameters and lays out every game's 25 platforms.'''
+        self.numGames = numGames
+        self.rng = numpy.random.default_rng(seed)
+        n = numGames
+
+        # Sprite sizes (the rects are set from the first image of each sprite)
+        self.doodleWidth, self.doodleHeight = imageSize("objects/right_face.png")
+        self.platformWidths = numpy.array([imageSize("objects/green.png")[0], \
+                                           imageSize("objects/blue.png")[0], \
+                                           imageSize("objects/brown1.png")[0]])
+        self.platformHeight = imageSize("objects/green.png")[1]
+        self.springWidth, self.springHeight = imageSize("objects/spring1.png")
+        self.bulletWidth, self.bulletHeight = imageSize("objects/bullet.png")
+        # Monster types: the single image monsters followed by the first
+        # image of each double image monster (same order as Monster.reset)
+        monsterImages = doodleJumpSprites.Monster.singleImages + \
+            tuple(images[0] for images in doodleJumpSprites.Monster.doubleImages)
+        monsterSizes = numpy.array([imageSize(path) for path in monsterImages])
+        self.monsterWidths = monsterSizes[:, 0]
+        self.monsterHeights = monsterSizes[:, 1]
+
+        # Doodle starts off jumping from the bottom middle of the screen
+        doodleRect = pygame.Rect(0, 0, self.doodleWidth, self.doodleHeight)
+        doodleRect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT - 50)
+        self.doodleLeft = numpy.full(n, doodleRect.left)
+        self.doodleTop = numpy.full(n, doodleRect.top)
+        self.doodleVelocity = numpy.full(n, -17)
+
+        # Per game bookkeeping
+        self.frame = numpy.zeros(n, dtype=int)
+        self.score = numpy.zeros(n, dtype=int)
+        self.hitMonster = numpy.zeros(n, dtype=bool)
+        self.gameOver = numpy.zeros(n, dtype=bool)
+        self.causeOfDeath = numpy.full(n, ALIVE)
+        self.extraHeight = numpy.zeros(n, dtype=int)
+        self.spaceBetween = numpy.full(n, 30)
+        self.goalHeight = numpy.full(n, 500)
+
+        # Create 25 platforms: blue platforms are the rarest,
+        # green platforms are the most common
+        platformNums = numpy.arange(NUM_PLATFORMS)
+        types = numpy.where(platformNums % 7 == 0, BLUE, \
+                            numpy.where(platformNums % 4 == 0, BROWN, GREEN))
+        self.platformType = numpy.tile(types, (n, 1))
+        self.platformLeft = numpy.zeros((n, NUM_PLATFORMS), dtype=int)
+        self.platformTop = numpy.zeros((n, NUM_PLATFORMS), dtype=int)
+        self.platformDx = numpy.full((n, NUM_PLATFORMS), 3)
+        self.platformBroken = numpy.zeros((n, NUM_PLATFORMS), dtype=bool)
+        self.platformVelocity = numpy.zeros((n, NUM_PLATFORMS), dtype=int)
+        centerY = SCREEN_HEIGHT - 20 - 30 * platformNums
+        self.resetPlatforms(numpy.ones((n, NUM_PLATFORMS), dtype=bool), \
+                            numpy.tile(centerY, (n, 1)))
+        self.yCoordinate = numpy.full(n, SCREEN_HEIGHT - 20 - 30 * NUM_PLATFORMS)
+
+        # Spring and Monster
+        self.springLeft = numpy.zeros(n, dtype=int)
+        self.springTop = numpy.zeros(n, dtype=int)
+        self.resetSpring(numpy.ones(n, dtype=bool))
+        self.monsterType = numpy.zeros(n, dtype=int)
+        self.monsterLeft = numpy.zeros(n, dtype=int)
+        self.monsterTop = numpy.zeros(n, dtype=int)
+        self.monsterVelocity = numpy.full(n, -5)
+        self.monsterDx = numpy.full(n, 5)
+        self.resetMonster(numpy.ones(n, dtype=bool))
+
+        # Bullets (a bullet slot is free when it isn't alive)
+        self.bulletAlive = numpy.zeros((n, NUM_BULLETS), dtype=bool)
+        self.bulletLeft = numpy.zeros((n, NUM_BULLETS), dtype=int)
+        self.bulletTop = numpy.zeros((n, NUM_BULLETS), dtype=int)
+
+    def randint(self, low, high, shape):
+        '''This method returns random integers between low and high
+        (inclusive, like random.randint) in an array of the given shape.'''
+        return self.rng.integers(low, high + 1, size=shape)
+
+    def resetPlatforms(self, mask, centerY):
+        '''This method accepts a boolean (games, platforms) mask and an array
+        of new center y coordinates as parameters. It gives the masked
+        platforms a random x position at those heights (Platform.reset).'''
+        centerX = self.randint(35, SCREEN_WIDTH - 35, mask.shape)
+        widths = self.platformWidths[self.platformType]
+        self.platformLeft = numpy.where(mask, centerX - widths // 2, self.platformLeft)
+        self.platformTop = numpy.where(mask, centerY - self.platformHeight // 2, \
+                                       self.platformTop)
+        self.platformBroken &= ~mask
+        self.platformVelocity = numpy.where(mask, 0, self.platformVelocity)
+
+    def resetSpring(self, mask):
+        '''This method accepts a boolean mask of games as a parameter and
+        places their Spring on a random green platform above the top of the
+        screen (Spring.reset).'''
+        candidates = (self.platformType == GREEN) & (self.platformTop < 0)
+        # Games without such a platform keep their Spring where it is
+        mask = mask & candidates.any(axis=1)
+        # Pick a random candidate by giving each one a random priority
+        priority = numpy.where(candidates, self.rng.random(candidates.shape), -1.0)
+        chosen = priority.argmax(axis=1)
+        rows = numpy.arange(self.numGames)
+        platformCenterX = self.platformLeft[rows, chosen] + \
+            self.platformWidths[self.platformType[rows, chosen]] // 2
+        centerX = platformCenterX + self.randint(-10, 10, self.numGames)
+        self.springLeft = numpy.where(mask, centerX - self.springWidth // 2, \
+                                      self.springLeft)
+        self.springTop = numpy.where(mask, self.platformTop[rows, chosen] + 5 - \
+                                     self.springHeight, self.springTop)
+
+    def resetMonster(self, mask):
+        '''This method accepts a boolean mask of games as a parameter and
+        gives their Monster a random type and a position far above the
+        screen (Monster.reset).'''
+        n = self.numGames
+        imageNum = self.randint(1, 2, n)
+        index = self.rng.integers(0, imageNum + 2)
+        # Double image monsters come after the 3 single image ones
+        monsterType = numpy.where(imageNum == 1, index, 3 + index)
+        centerX = self.randint(50, SCREEN_WIDTH - 50, n)
+        # Set the monster higher up off the screen
+        centerY = self.yCoordinate - self.randint(1500, 2000, n)
+        self.monsterType = numpy.where(mask, monsterType, self.monsterType)
+        self.monsterLeft = numpy.where(mask, centerX - self.monsterWidths[monsterType] // 2, \
+                                       self.monsterLeft)
+        self.monsterTop = numpy.where(mask, centerY - self.monsterHeights[monsterType] // 2, \
+                                      self.monsterTop)
+
+    def step(self, inputs):
+        '''This method accepts an array with the input bits of every game as a
+        parameter and advances every game that isn't over by one frame.'''
+        inputs = numpy.asarray(inputs)
+        playing = ~self.gameOver
+        canMove = playing & ~self.hitMonster
+        self.frame += playing
+
+        doodleWidth = self.doodleWidth
+        doodleHeight = self.doodleHeight
+        monsterWidth = self.monsterWidths[self.monsterType]
+        monsterHeight = self.monsterHeights[self.monsterType]
+
+        # Shooting fills the first free bullet slot
+        shooting = canMove & ((inputs & INPUT_SHOOT) != 0) & \
+            ~self.bulletAlive.all(axis=1)
+        slot = (~self.bulletAlive).argmax(axis=1)
+        rows = numpy.nonzero(shooting)[0]
+        self.bulletAlive[rows, slot[rows]] = True
+        bulletCenterX = self.doodleLeft + doodleWidth // 2 - 5
+        self.bulletLeft[rows, slot[rows]] = bulletCenterX[rows] - self.bulletWidth // 2
+        self.bulletTop[rows, slot[rows]] = self.doodleTop[rows]
+
+        # Doodle goes left/right as long as the arrow key is held down
+        goingLeft = canMove & ((inputs & INPUT_LEFT) != 0)
+        goingRight = canMove & ~goingLeft & ((inputs & INPUT_RIGHT) != 0)
+        self.doodleLeft += 7 * goingRight - 7 * goingLeft
+
+        # If the Doodle passes the bottom of the screen, game over
+        fell = playing & (self.doodleTop >= SCREEN_HEIGHT)
+        self.causeOfDeath = numpy.where(fell, numpy.where(self.hitMonster, MONSTER, FELL), \
+                                        self.causeOfDeath)
+        self.gameOver |= fell
+
+        # If the Doodle and Monster collide, the Doodle falls
+        touching = canMove & self.overlaps(self.doodleLeft, self.doodleTop, doodleWidth, \
+                                           doodleHeight, self.monsterLeft, \
+                                           self.monsterTop, monsterWidth, monsterHeight)
+        self.doodleVelocity = numpy.where(touching, -5, self.doodleVelocity)
+        self.hitMonster |= touching
+
+        # If a Monster collides with bullets, destroy them and reset the Monster
+        shot = self.bulletAlive & playing[:, None] & \
+            self.overlaps(self.monsterLeft[:, None], self.monsterTop[:, None], \
+                          monsterWidth[:, None], monsterHeight[:, None], \
+                          self.bulletLeft, self.bulletTop, self.bulletWidth, \
+                          self.bulletHeight)
+        self.bulletAlive &= ~shot
+        self.resetMonster(shot.any(axis=1))
+
+        # Platform and Spring collisions while the Doodle is falling
+        falling = canMove & ~self.hitMonster & (self.doodleVelocity > 0)
+        platformWidth = self.platformWidths[self.platformType]
+        landed = falling[:, None] & \
+            self.overlaps(self.doodleLeft[:, None], self.doodleTop[:, None], \
+                          doodleWidth, doodleHeight, self.platformLeft, \
+                          self.platformTop, platformWidth, self.platformHeight)
+        # Only the first colliding platform counts, and only with the Doodle's bottom
+        first = landed.argmax(axis=1)
+        rows = numpy.arange(self.numGames)
+        firstTop = self.platformTop[rows, first]
+        bounce = landed.any(axis=1) & \
+            (self.doodleTop + doodleHeight <= firstTop + self.platformHeight)
+        self.doodleTop = numpy.where(bounce, firstTop - doodleHeight, self.doodleTop)
+        self.doodleVelocity = numpy.where(bounce, -17, self.doodleVelocity)
+        # Brown platforms break and fall after the Doodle touches them
+        breaks = bounce & (self.platformType[rows, first] == BROWN)
+        self.platformBroken[rows[breaks], first[breaks]] = True
+
+        # Doodle jumps even higher if it lands on a Spring
+        sprung = falling & self.overlaps(self.doodleLeft, self.doodleTop, doodleWidth, \
+                                         doodleHeight, self.springLeft, \
+                                         self.springTop, self.springWidth, \
+                                         self.springHeight) & \
+            (self.doodleTop + doodleHeight <= self.springTop + self.springHeight)
+        self.doodleTop = numpy.where(sprung, self.springTop - doodleHeight, self.doodleTop)
+        self.doodleVelocity = numpy.where(sprung, -30, self.doodleVelocity)
+
+        # If the Doodle reaches half way up the screen while jumping,
+        # move everything down the screen by the Doodle's velocity
+        scrolling = playing & (self.doodleVelocity < 0) & \
+            (self.doodleTop <= SCREEN_HEIGHT / 2)
+        shift = numpy.where(scrolling, -self.doodleVelocity, 0)
+        self.doodleTop += shift
+
+        self.resetMonster(scrolling & (self.monsterTop >= SCREEN_HEIGHT))
+        self.monsterTop += shift
+
+        self.resetSpring(scrolling & \
+                         (self.springTop + self.springHeight // 2 >= SCREEN_HEIGHT))
+        self.springTop += shift
+
+        # Platforms that touch the bottom of the screen are reset higher up,
+        # each one spaceBetween above the one reset before it
+        self.platformTop += shift[:, None]
+        recycled = scrolling[:, None] & (self.platformTop >= SCREEN_HEIGHT)
+        order = numpy.cumsum(recycled, axis=1) - 1
+        newCenterY = self.yCoordinate[:, None] - order * self.spaceBetween[:, None]
+        self.resetPlatforms(recycled, newCenterY)
+        self.yCoordinate -= recycled.sum(axis=1) * self.spaceBetween
+
+        self.extraHeight += shift
+        self.yCoordinate += shift
+
+        # Increase the spacing between platforms as the Doodle gets higher
+        harder = playing & (self.spaceBetween < 55) & (self.score >= self.goalHeight)
+        self.spaceBetween += harder
+        self.goalHeight += 500 * harder
+
+        # Keep the highest height reached as the score
+        height = -self.doodleTop + SCREEN_HEIGHT + self.extraHeight
+        self.score = numpy.where(playing, numpy.maximum(self.score, height), self.score)
+
+        self.updateSprites(playing)
+
+    def updateSprites(self, playing):
+        '''This method accepts a boolean mask of games still being played as a
+        parameter and moves their sprites the way the sprites' update()
+        methods do.'''
+        moving = playing[:, None]
+
+        # Blue platforms move side to side
+        blue = moving & (self.platformType == BLUE)
+        self.platformLeft += numpy.where(blue, self.platformDx, 0)
+        platformRight = self.platformLeft + self.platformWidths[self.platformType]
+        bounced = blue & ((self.platformLeft < 0) | (platformRight > SCREEN_WIDTH))
+        self.platformDx = numpy.where(bounced, -self.platformDx, self.platformDx)
+
+        # Broken brown platforms fall faster and faster
+        broken = moving & self.platformBroken
+        self.platformTop += numpy.where(broken, self.platformVelocity, 0)
+        self.platformVelocity += broken
+
+        # Monster bounces up and down as it moves left and right
+        self.monsterTop += numpy.where(playing, self.monsterVelocity, 0)
+        self.monsterVelocity += playing
+        self.monsterVelocity = numpy.where(self.monsterVelocity > 5, -5, self.monsterVelocity)
+        self.monsterLeft += numpy.where(playing, self.monsterDx, 0)
+        monsterRight = self.monsterLeft + self.monsterWidths[self.monsterType]
+        bounced = playing & ((self.monsterLeft < 0) | (monsterRight > SCREEN_WIDTH))
+        self.monsterDx = numpy.where(bounced, -self.monsterDx, self.monsterDx)
+
+        # Doodle falls with increasing velocity (up to 10)
+        self.doodleTop += numpy.where(playing, self.doodleVelocity, 0)
+        self.doodleVelocity += playing & (self.doodleVelocity < 10)
+        # The Doodle wraps around the sides of the screen
+        doodleRight = self.doodleLeft + self.doodleWidth
+        offLeft = playing & (doodleRight < 0)
+        offRight = playing & ~offLeft & (self.doodleLeft > SCREEN_WIDTH)
+        self.doodleLeft = numpy.where(offLeft, SCREEN_WIDTH - self.doodleWidth // 2, \
+                                      self.doodleLeft)
+        self.doodleLeft = numpy.where(offRight, -(self.doodleWidth // 2), self.doodleLeft)
+
+        # Bullets fly up and die at the top of the screen
+        self.bulletTop -= 20 * (self.bulletAlive & moving)
+        self.bulletAlive &= self.bulletTop > 0
+
+    def overlaps(self, leftA, topA, widthA, heightA, leftB, topB, widthB, heightB):
+        '''This method accepts the positions and sizes of two sets of rects
+        and returns where they overlap (like pygame.Rect.colliderect).'''
+        return (leftA < leftB + widthB) & (leftB < leftA + widthA) & \
+            (topA < topB + heightB) & (topB < topA + heightA)
+
+    def run(self, policy, maxFrames=100000):
+        '''This method accepts a policy (a function taking the simulator and
+        returning an array of input bits) and a frame limit as parameters. It
+        steps every game until they are all over or the limit is reached.'''
+        while (not self.gameOver.all()) and (self.frame.max() < maxFrames):
+            self.step(policy(self))
+        return self.score
@@ -0,0 +1,163 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Shows the Doodle Jump screens, laid out at 401x620, in a
+                window of any size or fullscreen
+"""
+
+import pygame, weakref, collections, doodleJumpAssets, doodleJumpEngine
+
+# The size every screen is laid out at (all the game's coordinates)
+LOGICAL_SIZE = (doodleJumpEngine.SCREEN_WIDTH, doodleJumpEngine.SCREEN_HEIGHT)
+# The most scales whose images are kept (eg. windowed and fullscreen, and a
+# few sizes the window was dragged through)
+MAX_SCALES = 4
+
+class Renderer(object):
+    '''A class that owns the window and draws the game's screens into it at
+    any size. The screens keep working in logical coordinates (401x620);
+    the renderer fits that area into the window as large as it goes without
+    stretching it (the rest of the window stays black).
+
+    Nothing is scaled per frame: each image (sprite art, backgrounds, text)
+    is scaled once for the window's scale and kept until the scale changes,
+    and sprites are drawn with those images at their scaled positions. When
+    the window is the logical size, images and positions are used as they
+    are.'''
+    def __init__(self, windowSize=None, fullscreen=False, logicalSize=LOGICAL_SIZE):
+        '''This initializer takes the window size (the logical size by
+        default), whether to fill the whole display instead, and the logical
+        size, and opens the window.'''
+        self.logicalSize = logicalSize
+        self.windowSize = windowSize or logicalSize
+        self.fullscreen = fullscreen
+        # The screens and the game take their size from this surface (which
+        # is never drawn to, so it stays the logical size however the
+        # window changes)
+        self.canvas = pygame.Surface(logicalSize)
+        self.scale = None
+        # Scaled images keyed by the original surface (dropped with it), for
+        # each of the last scales used, latest last (so switching back, eg.
+        # out of fullscreen, doesn't scale them again)
+        self.scaledImages = collections.OrderedDict()
+        self.images = None
+        # Sprites whose image and rect are swapped for drawing
+        self.swapped = []
+        self.setMode()
+
+    def setMode(self):
+        '''This method opens the window (or switches to or from fullscreen)
+        and lays the screen out in it.'''
+        if self.fullscreen:
+            # (0, 0) is the size of the display
+            pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            pygame.display.set_mode(self.windowSize, pygame.RESIZABLE)
+        self.layout()
+
+    def layout(self):
+        '''This method works out the scale and where the screen goes in the
+        window, after it was opened or resized.'''
+        self.window = pygame.display.get_surface()
+        windowWidth, windowHeight = self.window.get_size()
+        logicalWidth, logicalHeight = self.logicalSize
+        scale = min(windowWidth / float(logicalWidth), windowHeight / float(logicalHeight))
+        self.viewport = pygame.Rect(0, 0, min(windowWidth, int(round(logicalWidth * scale))), \
+                                    min(windowHeight, int(round(logicalHeight * scale))))
+        self.viewport.center = self.window.get_rect().center
+        self.window.fill((0, 0, 0))
+
+        # Screens draw into the part of the window they fill
+        if self.viewport.size == self.window.get_size():
+            self.target = self.window
+        else:
+            self.target = self.window.subsurface(self.viewport)
+        self.identity = self.viewport.size == tuple(self.logicalSize)
+
+        if scale != self.scale:
+            self.scale = scale
+            self.images = self.scaledImages.pop(scale, None)
+            if self.images is None:
+                self.images = weakref.WeakKeyDictionary()
+            self.scaledImages[scale] = self.images
+            if len(self.scaledImages) > MAX_SCALES:
+                self.scaledImages.popitem(last=False)
+            # Images already loaded are scaled now rather than during a game
+            # (those scaled at this scale before are kept)
+            if not self.identity:
+                for surface in list(doodleJumpAssets.imageCache.surfaces.values()):
+                    self.getImage(surface)
+
+    def handleEvent(self, event):
+        '''This method accepts one pygame event and returns True if the
+        window changed (it was resized, or F11 toggled fullscreen) and the
+        screens have to be shown again.'''
+        if event.type == pygame.VIDEORESIZE:
+            if not self.fullscreen:
+                self.windowSize = event.size
+            self.layout()
+            return True
+        if (event.type == pygame.KEYDOWN) and (event.key == pygame.K_F11):
+            self.fullscreen = not self.fullscreen
+            self.setMode()
+            return True
+        return False
+
+    def getImage(self, surface):
+        '''This method accepts a surface laid out in logical pixels and
+        returns it at the window's scale, scaling it only the first time.'''
+        if self.identity:
+            return surface
+        image = self.images.get(surface)
+        if image is None:
+            width, height = surface.get_size()
+            image = pygame.transform.smoothscale(surface, \
+                                                 (max(1, int(round(width * self.scale))), \
+                                                  max(1, int(round(height * self.scale)))))
+            # (eg. the pause screen's translucency)
+            if surface.get_alpha() is not None:
+                image.set_alpha(surface.get_alpha())
+            self.images[surface] = image
+        return image
+
+    def apply(self, sprites):
+        '''This method accepts the sprites about to be drawn and gives each
+        one its scaled image and a rect at the window's scale, until
+        restore() is called.'''
+        if self.identity:
+            return
+        scale = self.scale
+        swapped = self.swapped
+        for sprite in sprites:
+            rect = sprite.rect
+            swapped.append((sprite, sprite.image, rect))
+            sprite.image = self.getImage(sprite.image)
+            sprite.rect = pygame.Rect(int(round(rect.left * scale)), \
+                                      int(round(rect.top * scale)), \
+                                      int(round(rect.width * scale)), \
+                                      int(round(rect.height * scale)))
+
+    def restore(self):
+        '''This method gives the sprites changed by apply() their own image
+        and rect back.'''
+        for sprite, image, rect in self.swapped:
+            sprite.image = image
+            sprite.rect = rect
+        self.swapped = []
+
+    def update(self, rects=None):
+        '''This method accepts the rects (in the screen's part of the window)
+        that were drawn, and pushes them to the display (the whole window if
+        there are none).'''
+        if rects is None:
+            pygame.display.flip()
+        elif self.target is self.window:
+            pygame.display.update(rects)
+        else:
+            offset = self.viewport.topleft
+            pygame.display.update([rect.move(offset) for rect in rects])
+
+    def toLogical(self, position):
+        '''This method accepts a position in the window (eg. the mouse's)
+        and returns it in logical coordinates.'''
+        return (int((position[0] - self.viewport.left) / self.scale), \
+                int((position[1] - self.viewport.top) / self.scale))
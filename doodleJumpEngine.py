@@ -0,0 +1,390 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Display-free simulation core for the Doodle Jump game
+"""
+
+import pygame, random, bisect, doodleJumpSprites, doodleJumpLevels, doodleJumpEntities
+
+# Size of the game window (the simulation uses the same coordinates)
+SCREEN_WIDTH = 401
+SCREEN_HEIGHT = 620
+
+# Input bits passed to GameState.step() for a single frame
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_SHOOT = 4
+# The pause button only matters to the renderer, but it is
+# recorded with the other inputs so replays show it
+INPUT_PAUSE = 8
+
+# Platforms are placed up to this far above the top of the screen (about
+# where the highest of the original 25 platforms started)
+SPAWN_MARGIN = 150
+
+# The sprite class of each platform type the level generator lays out
+PLATFORM_CLASSES = {"green": doodleJumpSprites.GreenPlatform, \
+                    "brown": doodleJumpSprites.BrownPlatform, \
+                    "blue": doodleJumpSprites.BluePlatform}
+
+class PlatformIndex(object):
+    '''A class that keeps platforms sorted by the top of their rect, so only
+    the few platforms near a range of heights need to be tested for
+    collisions (or culled below the screen).
+
+    Platforms that move up or down on their own (broken Brown Platforms)
+    are kept in a short list that is always tested.'''
+    def __init__(self, platforms):
+        '''This initializer takes a list of platforms as a parameter and
+        indexes them.'''
+        # Sorted keys (the top of each platform) and
+        # the platforms in the same order
+        self.keys = []
+        self.platforms = []
+        self.falling = []
+        self.maxHeight = 0
+        # Candidates are returned in this order (the order the platforms
+        # were added to the platform group in) so collisions are resolved
+        # the same way as testing the whole platform group
+        self.order = {}
+        self.added = 0
+        for platform in platforms:
+            self.insert(platform)
+
+    def insert(self, platform):
+        '''This method adds a platform at its current height.'''
+        self.order[platform] = self.added
+        self.added += 1
+        platform.indexKey = platform.rect.top
+        index = bisect.bisect_right(self.keys, platform.indexKey)
+        self.keys.insert(index, platform.indexKey)
+        self.platforms.insert(index, platform)
+        # Masks can be taller than the rect, and they are what gets tested
+        self.maxHeight = max(self.maxHeight, platform.rect.height, \
+                             platform.mask.get_size()[1])
+
+    def remove(self, platform):
+        '''This method removes a platform (wherever it is).'''
+        if platform in self.falling:
+            self.falling.remove(platform)
+            return
+        index = bisect.bisect_left(self.keys, platform.indexKey)
+        while self.platforms[index] is not platform:
+            index += 1
+        del self.keys[index]
+        del self.platforms[index]
+
+    def startFalling(self, platform):
+        '''This method moves a platform that now falls on its own (a broken
+        Brown Platform) to the list that is always tested.'''
+        self.remove(platform)
+        self.falling.append(platform)
+
+    def query(self, top, bottom):
+        '''This method accepts the top and bottom of a rect as parameters and
+        returns the platforms whose rect could overlap it vertically.'''
+        first = bisect.bisect_right(self.keys, top - self.maxHeight)
+        last = bisect.bisect_left(self.keys, bottom)
+        candidates = self.platforms[first:last] + self.falling
+        if len(candidates) > 1:
+            candidates.sort(key=self.order.get)
+        return candidates
+
+    def below(self, bottom):
+        '''This method accepts a y coordinate as a parameter and returns the
+        platforms whose top is at or below it.'''
+        first = bisect.bisect_left(self.keys, bottom)
+        return self.platforms[first:] + [platform for platform in self.falling \
+                                          if platform.rect.top >= bottom]
+
+class GameState(object):
+    '''A class holding everything needed to play one game of Doodle Jump
+    without a window, a clock or a mixer. Each call to step() advances the
+    game by one frame and returns the events the renderer should react to
+    (sounds to play and effects to draw).
+
+    Sprites keep world coordinates, which don't change when the screen
+    scrolls: only the camera (the world y coordinate at the top of the
+    screen) moves. The renderer draws everything relative to it.'''
+    def __init__(self, screen=None, seed=None, profiler=None, \
+                 weights=doodleJumpLevels.DEFAULT_WEIGHTS):
+        '''This initializer takes an optional screen surface (a plain,
+        off-screen surface of the same size is used when running headless), an
+        optional seed, an optional FrameProfiler (to time the phases of each
+        step) and an optional tuple of (platform type, weight) pairs (how often
+        each platform type comes up) as parameters, and sets up the Doodle,
+        platforms, Spring and Monster. Games with the same seed, weights and
+        inputs play out exactly the same.'''
+        # The sprites only use the screen to know its size
+        if screen is None:
+            screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = screen
+
+        # Every random choice of this game comes from its own generator
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.profiler = profiler
+
+        # Doodle starts off jumping from the bottom middle of the screen
+        self.doodle = doodleJumpSprites.Doodle(screen, (screen.get_width() / 2, \
+                                             screen.get_height() - 50), -17)
+
+        self.frame = 0
+        self.events = []
+        # World y coordinate of the top of the screen (it goes
+        # down as the screen moves up)
+        self.cameraY = 0
+
+        # Every sprite that moves on its own, in the order they are updated
+        # (platforms and bullets are moved all at once by the entity store)
+        self.movingSprites = pygame.sprite.Group()
+        self.entities = doodleJumpEntities.EntityStore(screen.get_width())
+
+        # Platforms are laid out ahead of time, a chunk at a time, by the
+        # level generator, and the ones that go below the bottom of the
+        # screen are kept (by type) to be used again higher up
+        # (platforms are built about a screen above the Doodle, so the spacing
+        # starts growing a screen higher to match the Doodle's score)
+        self.level = doodleJumpLevels.LevelGenerator(self.rng, screen.get_width(), weights, \
+                                                     goalHeight=500 + screen.get_height())
+        self.platformGroup = pygame.sprite.Group()
+        # Green Platforms are the ones a Spring can sit on
+        self.greenPlatforms = []
+        self.platformPools = dict((platformType, []) for platformType in PLATFORM_CLASSES)
+        # Platforms sorted by height for collision detection
+        self.platformIndex = PlatformIndex([])
+        self.spawnPlatforms()
+
+        self.spring = doodleJumpSprites.Spring(self.greenPlatforms, self.rng)
+        # Monsters start 1500 to 2000 pixels above the top of the screen
+        self.monster = doodleJumpSprites.Monster(screen, 0, self.rng)
+        self.bulletGroup = pygame.sprite.Group()
+        # Bullets are reused (a few are built up front, more if needed)
+        self.bulletPool = doodleJumpSprites.SpritePool(self.buildBullet, 16)
+        self.movingSprites.add(self.spring, self.monster, self.doodle)
+
+        # Whether everything moved down the screen during the last step
+        self.scrolled = False
+        self.score = 0
+        self.hitMonster = False
+        self.gameOver = False
+        self.causeOfDeath = None
+
+    def emit(self, name, data=None):
+        '''This method records an event (eg. a sound to play) for the renderer.'''
+        self.events.append((name, data))
+
+    def spawnPlatforms(self):
+        '''This method takes platforms off the level generator's queue until
+        the world is filled up to SPAWN_MARGIN above the top of the screen.
+        Each one reuses a platform of the same type that went below the
+        screen when there is one.'''
+        screen = self.screen
+        while True:
+            # The first platform (height 0) starts 20 pixels above the bottom
+            yCoordinate = screen.get_height() - 20 - self.level.peekHeight()
+            if yCoordinate < self.cameraY - SPAWN_MARGIN:
+                break
+            platformType, xCoordinate, height = self.level.pop()
+            pool = self.platformPools[platformType]
+            if pool:
+                platform = pool.pop()
+                platform.reset(yCoordinate, xCoordinate)
+            else:
+                platform = PLATFORM_CLASSES[platformType](screen, yCoordinate, self.rng, \
+                                                          xCoordinate, self.entities)
+            self.platformGroup.add(platform)
+            self.platformIndex.insert(platform)
+            if platformType == "green":
+                self.greenPlatforms.append(platform)
+            self.emit("platform", platform)
+
+    def recyclePlatform(self, platform):
+        '''This method takes a platform that went below the screen out of
+        the game and keeps it to be reused.'''
+        self.platformIndex.remove(platform)
+        # (this also takes it out of the renderer's groups)
+        platform.deactivate()
+        if platform.platformType == "green":
+            self.greenPlatforms.remove(platform)
+        self.platformPools[platform.platformType].append(platform)
+
+    def buildBullet(self):
+        '''This method builds a Bullet for the bullet pool (not moving until
+        it is fired).'''
+        bullet = doodleJumpSprites.Bullet(self.screen, store=self.entities)
+        bullet.stopEntity()
+        return bullet
+
+    def cull(self):
+        '''This method puts back whatever went below the bottom of the
+        screen: the Monster and Spring higher up, and platforms into their
+        pools.'''
+        bottom = self.cameraY + self.screen.get_height()
+        # A new monster, higher up
+        if self.monster.rect.top >= bottom:
+            self.monster.reset(self.cameraY)
+        if self.spring.rect.centery >= bottom:
+            self.spring.reset(self.greenPlatforms, self.cameraY)
+        for platform in self.platformIndex.below(bottom):
+            self.recyclePlatform(platform)
+
+    def step(self, inputs):
+        '''This method accepts the input bits (INPUT_LEFT, INPUT_RIGHT,
+        INPUT_SHOOT; INPUT_PAUSE is ignored) held during this frame as a
+        parameter, advances the game by one frame and returns the list of
+        (event name, data) tuples.'''
+        self.events = []
+        self.scrolled = False
+        if self.gameOver:
+            return self.events
+        self.frame += 1
+
+        screen = self.screen
+        profiler = self.profiler
+        doodle = self.doodle
+        monster = self.monster
+        spring = self.spring
+
+        # If the Doodle hits a Monster and is falling, it cannot move or shoot
+        if not self.hitMonster:
+            if inputs & INPUT_SHOOT:
+                bullet = self.bulletPool.acquire()
+                bullet.activate(doodle.rect.centerx - 5, doodle.rect.top)
+                self.bulletGroup.add(bullet)
+                doodle.shootUp()
+                self.emit("shoot", bullet)
+
+            # Doodle goes left/right as long as player holds down arrow key
+            if inputs & INPUT_LEFT:
+                doodle.goLeft()
+            elif inputs & INPUT_RIGHT:
+                doodle.goRight()
+
+        # If the Doodle passes the bottom of the screen, game over
+        if doodle.rect.top - self.cameraY >= screen.get_height():
+            self.emit("falling")
+            self.gameOver = True
+            if self.hitMonster:
+                self.causeOfDeath = "monster"
+            else:
+                self.causeOfDeath = "fell"
+
+        if profiler:
+            profiler.start("monster")
+        # If the Doodle and Monster collide, the Doodle falls
+        if (not self.hitMonster) and (doodle.rect.colliderect(monster.rect)):
+            self.emit("poof")
+            self.emit("dizzy")
+            self.emit("doodleHit")
+            doodle.fall()
+            self.hitMonster = True
+
+        # If a Monster collides with a bullet, reset the
+        # Monster higher up the screen and destroy the bullet
+        # (only bullets whose rect touches the Monster get the mask test)
+        collisions = [bullet for bullet in pygame.sprite.spritecollide(monster, \
+                      self.bulletGroup, False) if pygame.sprite.collide_mask(monster, bullet)]
+        if collisions:
+            self.emit("poof")
+            self.emit("monsterKilled", monster.rect.center)
+            monster.reset(self.cameraY)
+            for collision in collisions:
+                collision.deactivate()
+        # If the Doodle hasn't hit the Monster and is within
+        # 500 pixels of the Monster, a growling sound plays (it is emitted on
+        # every such step, and stops on the first step it isn't)
+        elif (not self.hitMonster) and (monster.rect.centery - doodle.rect.centery >= -500):
+            self.emit("growl")
+        if profiler:
+            profiler.stop("monster")
+            profiler.start("platforms")
+
+        # Only check for collisions between Doodle and platforms/spring when
+        # the Doodle hasn't hit a Monster and is falling (velocity > 0)
+        if (not self.hitMonster) and (doodle.getVelocity() > 0):
+            # Only the platforms around the Doodle's height are tested (its
+            # jumping images, and so their masks, are taller than its rect)
+            candidates = self.platformIndex.query(doodle.rect.top, doodle.rect.top + \
+                                                  doodle.mask.get_size()[1])
+            collisions = [platform for platform in candidates \
+                          if pygame.sprite.collide_mask(doodle, platform)]
+            if collisions:
+                # Making sure it's the Doodle's bottom that touches the platform
+                if doodle.rect.bottom <= collisions[0].rect.bottom:
+                    # Doodle is repositioned on platform and jumps again
+                    doodle.rect.bottom = collisions[0].rect.top
+                    self.emit("boing")
+                    doodle.jump(-17)
+
+                    # If platform is brown...
+                    if collisions[0].platformType == "brown":
+                        self.emit("breaking")
+                        # ...it breaks and falls after Doodle touches it
+                        collisions[0].platformBreaks()
+                        self.platformIndex.startFalling(collisions[0])
+
+            # Doodle jumps even higher if it lands on a Spring
+            if doodle.rect.colliderect(spring.rect):
+                # Making sure it's the Doodle's bottom that touches the Spring
+                if doodle.rect.bottom <= spring.rect.bottom:
+                    doodle.rect.bottom = spring.rect.top
+                    spring.changeImage()
+                    self.emit("boing2")
+                    doodle.jump(-30)
+        if profiler:
+            profiler.stop("platforms")
+            profiler.start("scroll")
+
+        # If the Doodle reaches half way up the screen, the screen moves up
+        # (only while jumping, meaning velocity < 0)
+        cameraMove = 0
+        if (doodle.getVelocity() < 0) and \
+           (doodle.rect.top - self.cameraY <= screen.get_height() / 2):
+            # The screen moves up at the current velocity of the Doodle
+            # (so the Doodle stays where it is on the screen)
+            self.scrolled = True
+            cameraMove = doodle.getVelocity()
+            self.cameraY += cameraMove
+
+        # Whatever went below the screen is put back higher up, and the
+        # next platforms come into range from the level's queue
+        self.cull()
+        if self.scrolled:
+            self.spawnPlatforms()
+        if profiler:
+            profiler.stop("scroll")
+
+        # Reverse the y coordinates (eg. 0 becomes 620, 620 becomes 0)
+        # and keep the highest score reached
+        height = -doodle.rect.top + screen.get_height()
+        self.score = max(self.score, height)
+
+        # Frames that didn't scroll build the level's next chunk
+        # (if it is needed) so scrolling only takes ready-made platforms
+        if not self.scrolled:
+            self.level.fill(1)
+
+        # Move every sprite (Doodle, Monster), then every platform and bullet
+        if profiler:
+            profiler.start("update")
+        self.movingSprites.update()
+        # Bullets that touch the top of the screen die (bullets fly up the
+        # screen, so they are moved with it too)
+        for bullet in self.entities.step(self.cameraY, cameraMove):
+            bullet.deactivate()
+        if profiler:
+            profiler.stop("update")
+
+        return self.events
+
+def runGame(policy, maxFrames=100000, seed=None):
+    '''This function accepts a policy (a function taking the GameState and
+    returning the input bits for the next frame), a frame limit and an
+    optional seed as parameters. It plays one headless game as fast as
+    possible and returns the final GameState.'''
+    state = GameState(seed=seed)
+    while (not state.gameOver) and (state.frame < maxFrames):
+        state.step(policy(state))
+    return state
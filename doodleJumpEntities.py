@@ -0,0 +1,232 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Keeps the positions, velocities, types and animation frames
+                of the Doodle Jump platforms and bullets in typed arrays
+"""
+
+import array, pygame
+
+# Entity types stored in EntityStore.kind
+GREEN = 0
+BROWN = 1
+BLUE = 2
+BULLET = 3
+
+class EntityStore(object):
+    '''A class that keeps many entities as slots in a few typed arrays (one
+    array per field) instead of as objects with their own attributes. The
+    position of an entity is the top left corner of its sprite's rect.
+
+    Only active entities that move are stepped, and each kind of move is
+    kept in its own list of slots, so idle slots (Green Platforms, bullets
+    waiting in a pool) cost nothing per step:
+    - Blue Platforms slide sideways, turning around at the sides of the screen
+    - Brown Platforms fall faster and faster once broken (frame 1)
+    - Bullets fly up until they reach the top of the screen'''
+    def __init__(self, screenWidth):
+        '''This initializer takes the width of the screen (where Blue
+        Platforms turn around) as a parameter.'''
+        self.screenWidth = screenWidth
+
+        # One item per slot in each array
+        self.x = array.array("i")
+        self.y = array.array("i")
+        self.dx = array.array("i")
+        self.dy = array.array("i")
+        self.width = array.array("H")
+        self.kind = array.array("B")
+        self.frame = array.array("B")
+        self.active = array.array("B")
+        # The sprite drawn for each slot (whose rect is kept up to date)
+        self.sprites = []
+        # The active slots that move, by how they move (dictionaries keep
+        # the order the slots started moving in and remove them in O(1))
+        self.sliding = {}
+        self.falling = {}
+        self.flying = {}
+
+    def add(self, sprite, kind, dx=0, dy=0):
+        '''This method accepts a sprite, its entity type and its velocity,
+        adds an (inactive) entity at the sprite's rect and returns its slot.'''
+        for column, value in ((self.x, sprite.rect.left), (self.y, sprite.rect.top), \
+                              (self.dx, dx), (self.dy, dy), \
+                              (self.width, sprite.rect.width), (self.kind, kind), \
+                              (self.frame, 0), (self.active, 0)):
+            column.append(value)
+        self.sprites.append(sprite)
+        return len(self.sprites) - 1
+
+    def activate(self, index):
+        '''This method accepts a slot and lets its entity move.'''
+        self.active[index] = 1
+        kind = self.kind[index]
+        if kind == BLUE:
+            self.sliding[index] = None
+        elif kind == BULLET:
+            self.flying[index] = None
+        elif (kind == BROWN) and self.frame[index]:
+            self.falling[index] = None
+
+    def deactivate(self, index):
+        '''This method accepts a slot and stops its entity moving.'''
+        self.active[index] = 0
+        self.sliding.pop(index, None)
+        self.falling.pop(index, None)
+        self.flying.pop(index, None)
+
+    def startFalling(self, index):
+        '''This method accepts the slot of a Brown Platform and breaks it, so
+        it falls from the next step on.'''
+        self.frame[index] = 1
+        if self.active[index]:
+            self.falling[index] = None
+
+    def getCount(self):
+        '''This accessor returns the number of active entities.'''
+        return sum(self.active)
+
+    def step(self, top=0, cameraMove=0):
+        '''This method accepts the y coordinate of the top of the screen and
+        how far the screen moved down the world during this frame (negative
+        when it moves up), moves every moving entity by one frame and returns
+        the sprites of the bullets that reached the top.'''
+        x, y, dx, dy, width = self.x, self.y, self.dx, self.dy, self.width
+        sprites = self.sprites
+        screenWidth = self.screenWidth
+        for index in self.sliding:
+            left = x[index] + dx[index]
+            x[index] = left
+            # Reverse the x direction at the sides of the screen
+            if (left < 0) or (left + width[index] > screenWidth):
+                dx[index] = -dx[index]
+            sprites[index].rect.left = left
+        for index in self.falling:
+            y[index] += dy[index]
+            # Velocity increases as the Platform falls
+            dy[index] += 1
+            sprite = sprites[index]
+            sprite.rect.top = y[index]
+            sprite.dirty = 1
+        finished = []
+        # Bullets fly up the screen rather than the world, so they also move
+        # with the screen (in the same pass, rather than all being shifted
+        # whenever it scrolls)
+        for index in self.flying:
+            bulletTop = y[index] + dy[index] + cameraMove
+            y[index] = bulletTop
+            sprites[index].rect.top = bulletTop
+            if bulletTop <= top:
+                finished.append(sprites[index])
+        return finished
+
+def column(name):
+    '''This function accepts the name of an EntityStore array and returns a
+    property that reads and writes the sprite's slot of it.'''
+    def getValue(sprite):
+        return getattr(sprite.store, name)[sprite.index]
+    def setValue(sprite, value):
+        getattr(sprite.store, name)[sprite.index] = value
+    return property(getValue, setValue)
+
+class EntitySprite(pygame.sprite.DirtySprite):
+    '''A sprite subclass that is a thin view of one slot of an EntityStore,
+    for the groups, collision tests and renderer. Its position, velocity and
+    animation frame live in the store (sprite.x, sprite.dy, sprite.frame,
+    ... read and write them), which moves it and keeps its rect up to date.
+
+    The sprite only holds its slot, image, mask and rect, in __slots__; the
+    groups it is in are kept in a tuple rather than a set of its own, and
+    what DirtySprite sets on every sprite is shared by the class.
+
+    A sprite built without a store gets one of its own, and then moves
+    itself when it is updated.'''
+    __slots__ = ("store", "ownsStore", "index", "image", "mask", "rect", "dirty", \
+                 "_layer", "spriteGroups")
+    kind = GREEN
+    blendmode = 0
+    source_rect = None
+    _visible = 1
+
+    x = column("x")
+    y = column("y")
+    dx = column("dx")
+    dy = column("dy")
+    frame = column("frame")
+    active = column("active")
+
+    def __init__(self, screen, store=None):
+        '''This initializer takes a screen surface and an optional
+        EntityStore as parameters.'''
+        # (DirtySprite's initializer isn't called, since it would give
+        # the sprite a dictionary and a set)
+        self.dirty = 1
+        self._layer = 0
+        self.spriteGroups = ()
+        self.ownsStore = store is None
+        if self.ownsStore:
+            store = EntityStore(screen.get_width())
+        self.store = store
+        self.index = None
+
+    def add(self, *groups):
+        '''This method accepts groups and adds the sprite to each of them.'''
+        for group in groups:
+            group.add(self)
+
+    def remove(self, *groups):
+        '''This method accepts groups and takes the sprite out of each of them.'''
+        for group in groups:
+            group.remove(self)
+
+    def add_internal(self, group):
+        '''This method is used by a group to record that the sprite is in it.'''
+        self.spriteGroups += (group,)
+
+    def remove_internal(self, group):
+        '''This method is used by a group to record that the sprite left it.'''
+        self.spriteGroups = tuple(spriteGroup for spriteGroup in self.spriteGroups \
+                                  if spriteGroup is not group)
+
+    def kill(self):
+        '''This method takes the sprite out of every group.'''
+        for group in self.spriteGroups:
+            group.remove_internal(self)
+        self.spriteGroups = ()
+
+    def groups(self):
+        '''This accessor returns a list of the groups the sprite is in.'''
+        return list(self.spriteGroups)
+
+    def alive(self):
+        '''This accessor returns True if the sprite is in any group.'''
+        return bool(self.spriteGroups)
+
+    def addEntity(self, dx=0, dy=0):
+        '''This method accepts the sprite's velocity and adds its entity to
+        the store (once its rect is set).'''
+        self.index = self.store.add(self, self.kind, dx, dy)
+
+    def moveEntity(self):
+        '''This method copies the rect's position into the store and lets
+        the entity move.'''
+        store, index = self.store, self.index
+        store.x[index] = self.rect.left
+        store.y[index] = self.rect.top
+        store.activate(index)
+
+    def stopEntity(self):
+        '''This method stops the entity moving (eg. while its sprite waits in
+        a pool).'''
+        self.store.deactivate(self.index)
+
+    def deactivate(self):
+        '''This method stops the entity and takes the sprite off the screen.'''
+        self.stopEntity()
+        self.kill()
+
+    def update(self):
+        '''This method moves the sprite (only when it has its own store;
+        otherwise the store's owner steps every entity at once).'''
+        if self.ownsStore:
+            for sprite in self.store.step():
+                sprite.deactivate()
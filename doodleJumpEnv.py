@@ -0,0 +1,200 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Reinforcement learning environment (reset/step, like Gym)
+                around the headless Doodle Jump simulation
+"""
+
+import argparse, random, sys, time
+import numpy, doodleJumpEngine, doodleJumpEntities, doodleJumpLevels
+from doodleJumpEngine import SCREEN_WIDTH, SCREEN_HEIGHT, INPUT_LEFT, INPUT_RIGHT, \
+     INPUT_SHOOT
+
+# The input bits of each action an agent can take
+ACTIONS = (0, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT, INPUT_LEFT | INPUT_SHOOT, \
+           INPUT_RIGHT | INPUT_SHOOT)
+ACTION_NAMES = ("none", "left", "right", "shoot", "left+shoot", "right+shoot")
+
+# Numbers in each part of an observation
+DOODLE_FEATURES = 4
+PLATFORM_FEATURES = 8
+SPRING_FEATURES = 3
+MONSTER_FEATURES = 3
+BULLET_FEATURES = 3
+
+class DoodleJumpEnv(object):
+    '''A class that plays one headless game at a time for an agent, with the
+    Gym-style reset(seed) and step(action) methods. No window, clock or mixer
+    is used, so it runs as fast as the simulation does.
+
+    An action is an index into ACTIONS, held for frameSkip frames. An
+    observation is a float32 NumPy array of observationSize numbers, always
+    in this order (positions are relative to the Doodle, divided by the
+    screen's width or height, and each thing further than a screen above or
+    below the Doodle is left out, which leaves zeros):
+    - Doodle: x and y on the screen, vertical velocity, whether it hit the
+      Monster
+    - the numPlatforms platforms nearest in height to the Doodle's feet,
+      nearest first: present, x and y (of the top) relative to the Doodle's
+      feet, green, brown, blue, broken, horizontal velocity
+    - Spring: present, x and y relative to the Doodle
+    - Monster: present, x and y relative to the Doodle
+    - the numBullets bullets nearest in height to the Monster: present, x
+      and y relative to the Doodle
+
+    The reward is the height climbed (in screens), minus deathPenalty when
+    the game is lost.'''
+    def __init__(self, frameSkip=4, numPlatforms=8, numBullets=3, maxFrames=20000, \
+                 deathPenalty=1.0, weights=doodleJumpLevels.DEFAULT_WEIGHTS):
+        '''This initializer takes the number of frames each action is held
+        for, the number of platforms and bullets in an observation, the
+        frames after which a game is cut short, the reward lost when the
+        game is lost and the (platform type, weight) pairs the levels are
+        built with.'''
+        self.frameSkip = frameSkip
+        self.numPlatforms = numPlatforms
+        self.numBullets = numBullets
+        self.maxFrames = maxFrames
+        self.deathPenalty = deathPenalty
+        self.weights = weights
+        self.actionCount = len(ACTIONS)
+        self.observationSize = DOODLE_FEATURES + numPlatforms * PLATFORM_FEATURES + \
+                               SPRING_FEATURES + MONSTER_FEATURES + \
+                               numBullets * BULLET_FEATURES
+        self.state = None
+        # The score the last reward was measured up to
+        self.lastScore = 0
+
+    def reset(self, seed=None):
+        '''This method accepts an optional seed (a random one is picked
+        otherwise), starts a new game and returns a tuple (observation,
+        info).'''
+        self.state = doodleJumpEngine.GameState(seed=seed, weights=self.weights)
+        # The game's score only starts counting on its first step (from the
+        # Doodle's starting height), so rewards are measured from that height
+        self.lastScore = max(self.state.score, \
+                             SCREEN_HEIGHT - self.state.doodle.rect.top)
+        return self.observe(), self.getInfo()
+
+    def step(self, action):
+        '''This method accepts an action (an index into ACTIONS), plays it
+        for frameSkip frames (fewer if the game ends) and returns a tuple
+        (observation, reward, terminated, truncated, info). terminated is
+        True when the game is lost and truncated when it reached maxFrames.'''
+        state = self.state
+        inputs = ACTIONS[action]
+        for frame in range(self.frameSkip):
+            state.step(inputs)
+            if state.gameOver or (state.frame >= self.maxFrames):
+                break
+        score = max(state.score, self.lastScore)
+        reward = (score - self.lastScore) / float(SCREEN_HEIGHT)
+        self.lastScore = score
+        if state.gameOver:
+            reward -= self.deathPenalty
+        truncated = (not state.gameOver) and (state.frame >= self.maxFrames)
+        return self.observe(), reward, state.gameOver, truncated, self.getInfo()
+
+    def getInfo(self):
+        '''This accessor returns a dictionary with the game's seed, score,
+        frame and cause of death (None while it is still going).'''
+        state = self.state
+        return {"seed": state.seed, "score": state.score, "frame": state.frame, \
+                "cause": state.causeOfDeath}
+
+    def observe(self):
+        '''This method returns the observation of the game as it is now.'''
+        state = self.state
+        observation = numpy.zeros(self.observationSize, numpy.float32)
+        doodle = state.doodle.rect
+        feet = doodle.bottom
+
+        observation[0] = doodle.centerx / float(SCREEN_WIDTH)
+        observation[1] = (doodle.centery - state.cameraY) / float(SCREEN_HEIGHT)
+        observation[2] = state.doodle.getVelocity() / 30.0
+        observation[3] = state.hitMonster
+        offset = DOODLE_FEATURES
+
+        # The platforms and bullets are read straight from the entity
+        # store's arrays (only the few picked ones are converted)
+        store = state.entities
+        y = numpy.frombuffer(store.y, numpy.intc)
+        kind = numpy.frombuffer(store.kind, numpy.uint8)
+        # (active is always 0 or 1)
+        active = numpy.frombuffer(store.active, numpy.bool_)
+
+        platforms = numpy.flatnonzero(active & (kind != doodleJumpEntities.BULLET))
+        distances = numpy.abs(y[platforms] - feet)
+        nearest = numpy.argsort(distances, kind="stable")[:self.numPlatforms]
+        nearest = platforms[nearest[distances[nearest] <= SCREEN_HEIGHT]]
+        for index in nearest.tolist():
+            platformKind = store.kind[index]
+            observation[offset:offset + PLATFORM_FEATURES] = (1, \
+                (store.x[index] + store.width[index] // 2 - doodle.centerx) / \
+                float(SCREEN_WIDTH), (store.y[index] - feet) / float(SCREEN_HEIGHT), \
+                platformKind == doodleJumpEntities.GREEN, \
+                platformKind == doodleJumpEntities.BROWN, \
+                platformKind == doodleJumpEntities.BLUE, \
+                (platformKind == doodleJumpEntities.BROWN) and (store.frame[index] > 0), \
+                store.dx[index] / 10.0)
+            offset += PLATFORM_FEATURES
+        offset = DOODLE_FEATURES + self.numPlatforms * PLATFORM_FEATURES
+
+        for sprite in (state.spring, state.monster):
+            rect = sprite.rect
+            if abs(rect.centery - doodle.centery) <= SCREEN_HEIGHT:
+                observation[offset:offset + 3] = (1, (rect.centerx - doodle.centerx) / \
+                                                  float(SCREEN_WIDTH), (rect.centery - \
+                                                  doodle.centery) / float(SCREEN_HEIGHT))
+            offset += 3
+
+        # (only bullets within a screen of the Doodle, like the rest)
+        bullets = numpy.flatnonzero(active & (kind == doodleJumpEntities.BULLET) & \
+                                    (numpy.abs(y - doodle.centery) <= SCREEN_HEIGHT))
+        if len(bullets):
+            monsterY = state.monster.rect.centery
+            nearest = bullets[numpy.argsort(numpy.abs(y[bullets] - monsterY), \
+                                            kind="stable")[:self.numBullets]]
+            for index in nearest.tolist():
+                observation[offset:offset + BULLET_FEATURES] = (1, \
+                    (store.x[index] + store.width[index] // 2 - doodle.centerx) / \
+                    float(SCREEN_WIDTH), (store.y[index] - doodle.centery) / \
+                    float(SCREEN_HEIGHT))
+                offset += BULLET_FEATURES
+        return observation
+
+def main(arguments=None):
+    '''This function plays episodes with random actions and prints how many
+    agent steps and game frames the environment runs per second.'''
+    parser = argparse.ArgumentParser(description="Time the Doodle Jump environment " \
+                                     "with random actions.")
+    parser.add_argument("--episodes", type=int, default=10)
+    parser.add_argument("--frame-skip", type=int, default=4)
+    parser.add_argument("--max-frames", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(arguments)
+
+    env = DoodleJumpEnv(frameSkip=options.frame_skip, maxFrames=options.max_frames)
+    rng = random.Random(options.seed)
+    steps = 0
+    frames = 0
+    startTime = time.perf_counter()
+    for episode in range(options.episodes):
+        observation, info = env.reset(options.seed + episode)
+        total = 0.0
+        done = False
+        while not done:
+            observation, reward, terminated, truncated, info = \
+                env.step(rng.randrange(env.actionCount))
+            total += reward
+            steps += 1
+            done = terminated or truncated
+        frames += info["frame"]
+        print("seed %6d  score %7d  frames %6d  return %7.2f  %s" % (info["seed"], \
+              info["score"], info["frame"], total, info["cause"] or "timeout"))
+    elapsed = time.perf_counter() - startTime
+    print("%d steps, %d frames in %.2f s (%.0f steps/s, %.0f frames/s)" % (steps, \
+          frames, elapsed, steps / max(elapsed, 1e-9), frames / max(elapsed, 1e-9)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Builds the Doodle Jump level ahead of the Doodle, one chunk of
+                platforms at a time
+"""
+
+import collections
+
+# How often each platform type comes up (the same mix as the original 25
+# platforms: every 7th was blue, every other 4th was brown, the rest green)
+DEFAULT_WEIGHTS = (("green", 15), ("brown", 6), ("blue", 4))
+
+class LevelGenerator(object):
+    '''A class that lays out platforms as (type, x coordinate, height) specs,
+    where the height is measured up from the first platform. Whole chunks of
+    platforms are built into a queue ahead of time, so taking the next
+    platform never has to generate anything.
+
+    The spacing between platforms follows the game's difficulty ramp: it
+    grows by 1 pixel (up to 55) every 500 pixels of height after the first
+    goalHeight.'''
+    def __init__(self, rng, screenWidth, weights=DEFAULT_WEIGHTS, chunkSize=10, \
+                 lookahead=3, goalHeight=500):
+        '''This initializer takes the game's random number generator, the
+        screen width, a tuple of (platform type, weight) pairs, the number of
+        platforms per chunk, the number of chunks to keep queued and the
+        height where the spacing first grows. The weights must give green
+        platforms a chance, since Springs only sit on those.'''
+        if dict(weights).get("green", 0) <= 0:
+            raise ValueError("platform weights need a green weight above 0, got " + \
+                             repr(weights))
+        self.rng = rng
+        self.screenWidth = screenWidth
+        self.types = [platformType for platformType, weight in weights]
+        self.weights = [weight for platformType, weight in weights]
+        self.chunkSize = chunkSize
+        self.lookahead = lookahead
+        self.queue = collections.deque()
+        self.chunksBuilt = 0
+
+        # Height of the next platform to build and the difficulty ramp
+        self.height = 0
+        self.spaceBetween = 30
+        self.goalHeight = goalHeight
+
+        self.fill()
+
+    def buildChunk(self):
+        '''This method builds the next chunk of platforms onto the queue.'''
+        types = self.rng.choices(self.types, self.weights, k=self.chunkSize)
+        # Every chunk has a green platform, since Springs only sit on those
+        if "green" not in types:
+            types[self.rng.randint(0, self.chunkSize - 1)] = "green"
+
+        for platformType in types:
+            xCoordinate = self.rng.randint(35, self.screenWidth - 35)
+            self.queue.append((platformType, xCoordinate, self.height))
+
+            # Increase the spacing between platforms as the level gets higher
+            if (self.spaceBetween < 55) and (self.height >= self.goalHeight):
+                self.spaceBetween += 1
+                self.goalHeight += 500
+            self.height += self.spaceBetween
+        self.chunksBuilt += 1
+
+    def fill(self, maxChunks=None):
+        '''This method builds chunks until the lookahead is queued, or at
+        most maxChunks of them (eg. one per idle frame).'''
+        built = 0
+        while (len(self.queue) < self.lookahead * self.chunkSize) and \
+              ((maxChunks is None) or (built < maxChunks)):
+            self.buildChunk()
+            built += 1
+
+    def peekHeight(self):
+        '''This method returns the height of the next platform in the queue.'''
+        if not self.queue:
+            self.buildChunk()
+        return self.queue[0][2]
+
+    def pop(self):
+        '''This method takes the next (type, x coordinate, height) platform
+        spec off the queue (building a chunk only if the queue ran dry).'''
+        if not self.queue:
+            self.buildChunk()
+        return self.queue.popleft()
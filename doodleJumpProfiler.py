@@ -0,0 +1,95 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Times each phase of the Doodle Jump frame and writes the
+                per-frame timings to JSON and CSV traces
+"""
+
+import collections, json, time
+
+# The phases of a frame, in the order they run
+PHASES = ("events", "monster", "platforms", "scroll", "update", "draw", "flip")
+# The most frames kept for the trace (about 5 minutes at 120 frames per
+# second); older frames are dropped so profiling can stay on for a long time
+MAX_FRAMES = 36000
+
+class FrameProfiler(object):
+    '''A class that times the phases of every frame. A phase can run more
+    than once in a frame (eg. when the simulation catches up by several
+    steps), in which case its times are added together.'''
+    def __init__(self, window=120, maxFrames=MAX_FRAMES):
+        '''This initializer takes the number of recent frames the rolling
+        percentiles are taken over and the number of frames kept for the
+        trace.'''
+        self.frames = collections.deque(maxlen=maxFrames)
+        self.frameCount = 0
+        self.recent = dict((phase, collections.deque(maxlen=window)) \
+                           for phase in PHASES + ("total",))
+        self.current = None
+        self.started = {}
+        self.frameStart = 0.0
+
+    def beginFrame(self):
+        '''This method starts timing a new frame.'''
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.current["steps"] = 0
+        self.frameStart = time.perf_counter()
+
+    def start(self, phase):
+        '''This method accepts a phase name and starts timing it.'''
+        self.started[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        '''This method accepts a phase name and adds the time since start()
+        to the current frame.'''
+        if self.current is not None:
+            self.current[phase] += (time.perf_counter() - self.started[phase]) * 1000
+
+    def countStep(self):
+        '''This method counts one simulation step run during the frame.'''
+        if self.current is not None:
+            self.current["steps"] += 1
+
+    def endFrame(self):
+        '''This method finishes timing the current frame and stores it.'''
+        if self.current is None:
+            return
+        frame = self.current
+        frame["frame"] = self.frameCount
+        self.frameCount += 1
+        frame["total"] = (time.perf_counter() - self.frameStart) * 1000
+        self.frames.append(frame)
+        for phase in self.recent:
+            self.recent[phase].append(frame[phase])
+        self.current = None
+
+    def getPercentile(self, phase, percent):
+        '''This method accepts a phase name and a percentage and returns that
+        percentile (in milliseconds) of the phase over the recent frames.'''
+        times = sorted(self.recent[phase])
+        if not times:
+            return 0.0
+        return times[min(len(times) - 1, int(len(times) * percent / 100.0))]
+
+    def getSummary(self):
+        '''This accessor returns a list of (phase, p50, p99) tuples for every
+        phase and the whole frame.'''
+        return [(phase, self.getPercentile(phase, 50), self.getPercentile(phase, 99)) \
+                for phase in PHASES + ("total",)]
+
+    def saveJSON(self, path):
+        '''This method accepts a file path and writes the kept frames'
+        timings to it as JSON.'''
+        with open(path, "w") as traceFile:
+            json.dump({"phases": list(PHASES), "units": "ms", \
+                       "frames": list(self.frames)}, traceFile)
+
+    def saveCSV(self, path):
+        '''This method accepts a file path and writes the kept frames'
+        timings to it as CSV, one row per frame.'''
+        columns = ("frame", "steps") + PHASES + ("total",)
+        with open(path, "w") as traceFile:
+            traceFile.write(",".join(columns) + "\n")
+            for frame in self.frames:
+                traceFile.write("%d,%d," % (frame["frame"], frame["steps"]) + \
+                                ",".join("%.4f" % frame[column] \
+                                         for column in columns[2:]) + "\n")
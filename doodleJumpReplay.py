@@ -0,0 +1,131 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Records and re-simulates Doodle Jump games from their inputs
+"""
+
+import struct, sys, time
+import doodleJumpEngine
+
+# File layout: a fixed header followed by (input bits, repeat count) runs,
+# since the same keys are usually held for many frames in a row
+MAGIC = b"DJRP"
+# (version 2: platforms come from the chunked level generator,
+# version 3: world coordinates, with everything below the screen culled
+# every step)
+VERSION = 3
+HEADER = struct.Struct("<4sBQIi")
+RUN = struct.Struct("<BH")
+MAX_RUN = 0xFFFF
+
+class ReplayError(Exception):
+    '''An exception raised for files that aren't valid replays.'''
+
+class Recorder(object):
+    '''A class that collects the input bits of every frame of one game.'''
+    def __init__(self, seed):
+        '''This initializer takes the seed of the game being recorded.'''
+        self.seed = seed
+        self.inputs = []
+
+    def record(self, inputs):
+        '''This method accepts the input bits of one frame and stores them.'''
+        self.inputs.append(inputs)
+
+    def save(self, path, score):
+        '''This method accepts a file path and the final score of the game as
+        parameters and writes the replay file.'''
+        saveReplay(path, self.seed, self.inputs, score)
+
+def encodeRuns(inputs):
+    '''This function accepts a list of per-frame input bits and returns the
+    run-length encoded bytes.'''
+    data = bytearray()
+    index = 0
+    while index < len(inputs):
+        bits = inputs[index]
+        count = 1
+        while (index + count < len(inputs)) and (inputs[index + count] == bits) \
+              and (count < MAX_RUN):
+            count += 1
+        data += RUN.pack(bits, count)
+        index += count
+    return bytes(data)
+
+def decodeRuns(data):
+    '''This function accepts run-length encoded bytes and returns the list of
+    per-frame input bits.'''
+    if len(data) % RUN.size:
+        raise ReplayError("truncated input data")
+    inputs = []
+    for bits, count in RUN.iter_unpack(data):
+        inputs.extend([bits] * count)
+    return inputs
+
+def saveReplay(path, seed, inputs, score):
+    '''This function accepts a file path, the game's seed, its list of
+    per-frame input bits and the final score, and writes the replay file.'''
+    with open(path, "wb") as replayFile:
+        replayFile.write(HEADER.pack(MAGIC, VERSION, seed, len(inputs), score))
+        replayFile.write(encodeRuns(inputs))
+
+def loadReplay(path):
+    '''This function accepts a file path and returns the (seed, inputs, score)
+    stored in the replay file.'''
+    with open(path, "rb") as replayFile:
+        data = replayFile.read()
+    if len(data) < HEADER.size:
+        raise ReplayError(path + " is too short to be a replay")
+    magic, version, seed, frames, score = HEADER.unpack_from(data)
+    if (magic != MAGIC) or (version != VERSION):
+        raise ReplayError(path + " is not a version " + str(VERSION) + " replay")
+    inputs = decodeRuns(data[HEADER.size:])
+    if len(inputs) != frames:
+        raise ReplayError(path + " has " + str(len(inputs)) + " frames, expected " + \
+                          str(frames))
+    return seed, inputs, score
+
+def playReplay(seed, inputs):
+    '''This function accepts a seed and a list of per-frame input bits. It
+    re-simulates the game headless as fast as possible and returns the final
+    GameState.'''
+    state = doodleJumpEngine.GameState(seed=seed)
+    for bits in inputs:
+        state.step(bits)
+    return state
+
+def verifyReplay(path):
+    '''This function accepts the path of a replay file, re-simulates it and
+    returns a tuple (matches, recorded score, simulated score).'''
+    seed, inputs, score = loadReplay(path)
+    state = playReplay(seed, inputs)
+    return state.score == score, score, state.score
+
+def main(arguments=None):
+    '''This function verifies every replay file given on the command line and
+    returns 1 if any of them doesn't reproduce its recorded score.'''
+    if arguments is None:
+        arguments = sys.argv[1:]
+    if not arguments:
+        print("usage: python doodleJumpReplay.py REPLAY [REPLAY ...]")
+        return 2
+
+    failures = 0
+    for path in arguments:
+        startTime = time.perf_counter()
+        try:
+            matches, recorded, simulated = verifyReplay(path)
+        except (OSError, ReplayError) as error:
+            print("ERROR     " + str(error))
+            failures += 1
+            continue
+        if matches:
+            verdict = "OK      "
+        else:
+            verdict = "MISMATCH"
+            failures += 1
+        print("%s  %s  recorded %d, simulated %d (%.3f s)" % (verdict, path, \
+              recorded, simulated, time.perf_counter() - startTime))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
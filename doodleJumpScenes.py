@@ -0,0 +1,707 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: The screens of the Doodle Jump game and the manager that
+                switches between them on one display surface
+"""
+
+import pygame, os, time, doodleJumpAssets, doodleJumpSprites, doodleJumpEngine, \
+       doodleJumpReplay, doodleJumpTiming, doodleJumpProfiler, doodleJumpScores, \
+       doodleJumpAudio
+
+# Only push the parts of the screen that changed to the display
+# (set to False to always flip the whole screen)
+DIRTY_RECTS = True
+# Print the image and collision mask cache counters once a second while
+# playing (the masks built per second should drop to 0 after a moment)
+SHOW_CACHE_STATS = False
+# Print the size and use of the Bullet, Poof and Dizziness pools once a
+# second while playing
+SHOW_POOL_STATS = False
+# Print the mixer calls per second and the sound effects skipped (by their
+# cooldown or channel budget) once a second while playing
+SHOW_AUDIO_STATS = False
+# Simulation steps per second (this sets the speed of the game) and the
+# most frames drawn per second (0 draws as many as the machine can)
+STEP_RATE = 30
+MAX_FPS = 120
+# Print the frames drawn and simulation steps run once a second
+SHOW_TIMING = False
+# Print each frame that took so long some simulation steps were skipped
+SHOW_DROPPED_STEPS = False
+# Time each phase of the game's frames, show their rolling p50/p99 next to
+# the score bar (F3 hides it) and write the per-frame trace to profiles/
+PROFILE = False
+
+def refreshScreen(allSprites, renderer, fullUpdate=False, profiler=None):
+    '''This function accepts a LayeredDirty sprite group, the Renderer,
+    whether the whole screen changed (eg. it scrolled) and an optional
+    FrameProfiler as parameters. It draws the sprites that changed and updates
+    only those parts of the display, or redraws and flips the whole screen.'''
+    if profiler:
+        profiler.start("draw")
+    # Sprites are drawn at the window's scale with their pre-scaled images
+    renderer.apply(allSprites)
+    screen = renderer.target
+    if fullUpdate or not DIRTY_RECTS:
+        allSprites.repaint_rect(screen.get_rect())
+        allSprites.draw(screen)
+        rects = None
+    else:
+        # Some images are bigger than their sprite's rect (eg. the Doodle's
+        # jumping images), so the whole image of every redrawn sprite is
+        # pushed along with the rects the group reports
+        redrawn = [sprite for sprite in allSprites if sprite.dirty and sprite.visible]
+        rects = allSprites.draw(screen)
+        for sprite in redrawn:
+            rects.append(sprite.image.get_rect(topleft=sprite.rect.topleft))
+    renderer.restore()
+    if profiler:
+        profiler.stop("draw")
+        profiler.start("flip")
+    renderer.update(rects)
+    if profiler:
+        profiler.stop("flip")
+
+def showLoading(renderer, preloader, paths):
+    '''This function accepts the Renderer, the Preloader and the files the
+    first scene needs. It shows a progress bar (of every file queued) until
+    those files are decoded, and returns False if the window was closed in
+    the meantime.'''
+    pygame.display.set_caption("Doodle Jump")
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            renderer.handleEvent(event)
+        # (drawn straight into the window, so it is sized to fit it)
+        screen = renderer.target
+        bar = pygame.Rect(0, 0, screen.get_width() - 100, 16)
+        bar.center = screen.get_rect().center
+        decoded, queued = preloader.getProgress()
+        screen.fill((250, 245, 235))
+        pygame.draw.rect(screen, (0, 0, 0), bar, 2)
+        pygame.draw.rect(screen, (0, 0, 0), (bar.left, bar.top, \
+                                              bar.width * decoded // max(queued, 1), \
+                                              bar.height))
+        pygame.display.flip()
+        # Redraw about 30 times a second until the files are ready
+        if preloader.waitFor(paths, 1 / 30.0):
+            return True
+
+class Scene(object):
+    '''A base class for one screen of the game. Scenes are built once and kept
+    by the SceneManager, so their backgrounds and sprites stay loaded.'''
+    caption = "Doodle Jump"
+    # The name of the scene's background in the ResourceBank
+    backgroundName = None
+    # Whether the manager's profiler times this scene's frames
+    profiled = False
+
+    def __init__(self, manager):
+        '''This initializer takes the scene manager as a parameter and keeps
+        its screen and resource bank.'''
+        self.manager = manager
+        # The screen's size is the logical size, whatever the window's
+        self.screen = manager.screen
+        self.renderer = manager.renderer
+        self.bank = manager.bank
+        self.background = None
+        self.allSprites = pygame.sprite.LayeredDirty()
+        # Sprites drawn where they are on the screen, whatever the camera
+        # (eg. the score bar); the rest are drawn relative to the camera
+        self.hudSprites = set()
+        # Sound effects are played through the manager's channel budget
+        self.voices = manager.voices
+
+    def getBackground(self):
+        '''This accessor returns the scene's background, loading it the first
+        time the scene is shown (so building a scene doesn't wait for it).'''
+        if self.background is None:
+            self.background = self.buildBackground()
+        return self.background
+
+    def buildBackground(self):
+        '''This method returns the scene's background surface.'''
+        return self.bank.getBackground(self.backgroundName)
+
+    def show(self):
+        '''This method puts the scene's caption, background and sprites back
+        on the screen.'''
+        pygame.display.set_caption(self.caption)
+        background = self.renderer.getImage(self.getBackground())
+        self.renderer.target.blit(background, (0, 0))
+        pygame.display.flip()
+        self.allSprites.clear(self.renderer.target, background)
+        # Sprites that haven't changed since the scene was last shown
+        # have to be drawn again over the background
+        for sprite in self.allSprites:
+            if sprite.dirty < 2:
+                sprite.dirty = 1
+
+    def enter(self):
+        '''This method is called when the manager switches to the scene.'''
+        self.show()
+
+    def resume(self):
+        '''This method is called when an overlay scene on top of this one is
+        closed.'''
+        self.show()
+
+    def exit(self):
+        '''This method is called when the manager switches away from the
+        scene (but not when an overlay covers it).'''
+
+    def getCamera(self):
+        '''This accessor returns the y coordinate of the scene's sprites
+        that is drawn at the top of the screen.'''
+        return 0
+
+    def getMousePosition(self):
+        '''This accessor returns where the mouse is on the screen (in
+        logical coordinates).'''
+        return self.renderer.toLogical(pygame.mouse.get_pos())
+
+    def handleEvent(self, event):
+        '''This method accepts one pygame event and reacts to it.'''
+        if event.type == pygame.QUIT:
+            pygame.mixer.music.fadeout(700)
+            self.manager.quit()
+
+    def update(self):
+        '''This method moves the scene forward by one simulation step.'''
+        self.allSprites.update()
+
+    def draw(self):
+        '''This method draws the frame to the display.'''
+        refreshScreen(self.allSprites, self.renderer)
+
+class MainMenuScene(Scene):
+    '''The main menu, with the instructions and the play button.'''
+    caption = "Main Menu"
+    backgroundName = "mainMenu"
+
+    def __init__(self, manager):
+        '''This initializer builds the menu's sprites.'''
+        Scene.__init__(self, manager)
+
+        # E - ENTITIES
+        # Sprites for: play button, doodle
+        self.playButton = doodleJumpSprites.Button(0, (140, 200))
+        self.doodle = doodleJumpSprites.Doodle(self.screen, \
+                                               (80, self.screen.get_height()), -17)
+        self.allSprites.add(self.playButton, self.doodle)
+
+    def buildBackground(self):
+        '''This method returns a copy of the menu's background with the
+        instructions drawn on it (so they are restored when sprites are
+        cleared).'''
+        background = Scene.buildBackground(self).copy()
+        messages = ("   use the left", " and right arrow", "   keys to move", \
+                    "use the up arrow", "   key or space", "   bar to shoot")
+        yCoordinate = 375
+        for message in messages:
+            instructions = doodleJumpAssets.renderText("doodle_jump_font.ttf", 20, message)
+            background.blit(instructions, (248, yCoordinate))
+            if message == "   keys to move":
+                yCoordinate += 40
+            else:
+                yCoordinate += 25
+        return background
+
+    def enter(self):
+        '''This method starts the Doodle bouncing from the bottom again.'''
+        # A - ASSIGN
+        self.doodle.reset((80, self.screen.get_height()), -17)
+        self.bank.playMusic()
+        Scene.enter(self)
+
+    def handleEvent(self, event):
+        '''This method starts a game when the play button is clicked.'''
+        Scene.handleEvent(self, event)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.playButton.rect.collidepoint(self.getMousePosition()):
+                self.voices.trigger("click")
+                self.manager.switchTo("play")
+
+    def update(self):
+        '''This method makes the Doodle bounce on an "imaginary" platform.'''
+        if self.doodle.rect.bottom >= self.screen.get_height() - 120:
+            self.doodle.jump(-17)
+        Scene.update(self)
+
+class GameOverScene(Scene):
+    '''The game over screen, with the scores and the play again and main menu
+    buttons.'''
+    caption = "Game Over"
+    backgroundName = "gameOver"
+
+    def __init__(self, manager):
+        '''This initializer builds the screen's sprites.'''
+        Scene.__init__(self, manager)
+
+        # E - ENTITIES
+        # Sprites for: score, high score, play again button, main menu button, doodle
+        self.scoreKeeper = doodleJumpSprites.ScoreKeeper("score: ", 0, \
+                                            self.screen.get_width() / 2 - 70, 250)
+        self.highScoreKeeper = doodleJumpSprites.ScoreKeeper("high score: ", 0, \
+                                            self.screen.get_width() / 2 - 90, 300)
+        self.playAgainButton = doodleJumpSprites.Button(1, \
+                                            (self.screen.get_width() / 2, 390))
+        self.menuButton = doodleJumpSprites.Button(2, (self.screen.get_width() / 2, 450))
+        self.doodle = doodleJumpSprites.Doodle(self.screen, (0, -20), 10)
+        # How the score compares with today's runs
+        self.rankLabel = doodleJumpSprites.Label("", (0, 338))
+        self.allSprites.add(self.scoreKeeper, self.highScoreKeeper, self.rankLabel, \
+                            self.playAgainButton, self.menuButton, self.doodle)
+
+    def enter(self, score=0, doodleCenterX=0):
+        '''This method accepts the score of the game that just ended and the
+        Doodle's center x, and drops the Doodle in from the top. The high
+        score and today's ranking come from the score history (which the
+        game just added its run to).'''
+        scores = self.manager.scores
+        today = doodleJumpScores.getDay()
+        self.scoreKeeper.reset(score)
+        self.highScoreKeeper.reset(max(score, scores.getHighScore()))
+        self.rankLabel.setText("better than %d%% of today's %d runs" % \
+                               (scores.getPercentile(score, today), scores.getCount(today)))
+        self.rankLabel.rect.centerx = self.screen.get_width() / 2
+        self.doodle.reset((doodleCenterX, -20), 10)
+        # The Doodle was killed the last time it fell off the screen
+        if not self.doodle.alive():
+            self.allSprites.add(self.doodle)
+        self.bank.playMusic()
+        Scene.enter(self)
+
+    def handleEvent(self, event):
+        '''This method starts another game or goes back to the main menu when
+        a button is clicked.'''
+        Scene.handleEvent(self, event)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.playAgainButton.rect.collidepoint(self.getMousePosition()):
+                self.voices.trigger("click")
+                self.manager.switchTo("play")
+            elif self.menuButton.rect.collidepoint(self.getMousePosition()):
+                self.voices.trigger("click")
+                self.manager.switchTo("mainMenu")
+
+    def update(self):
+        '''This method lets the Doodle fall, and it dies when it touches the
+        bottom of the screen.'''
+        if self.doodle.rect.top >= self.screen.get_height():
+            self.doodle.kill()
+        Scene.update(self)
+
+class PauseScene(Scene):
+    '''The pause screen, drawn as an overlay on top of the game.'''
+    backgroundName = "paused"
+
+    def __init__(self, manager):
+        '''This initializer builds the overlay's resume button.'''
+        Scene.__init__(self, manager)
+
+        # E - ENTITIES
+        # (the bank's pause background is already translucent)
+        self.resumeButton = doodleJumpSprites.Button(4, (self.screen.get_width() / 2, 450))
+        self.allSprites.add(self.resumeButton)
+
+    def show(self):
+        '''This method darkens the game underneath and keeps its caption.'''
+        self.renderer.target.blit(self.renderer.getImage(self.getBackground()), (0, 0))
+        pygame.display.flip()
+        # The button is cleared with what the overlay covers
+        self.allSprites.clear(self.renderer.target, self.renderer.target.copy())
+        self.resumeButton.dirty = 1
+
+    def handleEvent(self, event):
+        '''This method closes the overlay when the resume button is clicked.'''
+        Scene.handleEvent(self, event)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.resumeButton.rect.collidepoint(self.getMousePosition()):
+                self.voices.trigger("click")
+                self.manager.pop()
+
+class PlayScene(Scene):
+    '''The Doodle Jump game itself.'''
+    caption = "Doodle Jump Game"
+    backgroundName = "game"
+    profiled = True
+
+    def __init__(self, manager):
+        '''This initializer builds the sprites that are kept from one game to
+        the next.'''
+        Scene.__init__(self, manager)
+
+        # E - ENTITIES
+        # Sprites for: score keeper, score bar, pause button
+        self.scoreKeeper = doodleJumpSprites.ScoreKeeper("", 0, 12, 0)
+        self.scoreBar = doodleJumpSprites.ScoreBar()
+        self.pauseButton = doodleJumpSprites.Button(3, (self.screen.get_width() - 20, 20))
+        # Sprites that are only drawn here (the simulation moves the rest)
+        self.effectSprites = pygame.sprite.Group()
+        # Effects are reused from one Monster (or game) to the next
+        self.poofPool = doodleJumpSprites.SpritePool(doodleJumpSprites.Poof, 2)
+        self.dizzinessPool = doodleJumpSprites.SpritePool(doodleJumpSprites.Dizziness, 1)
+        # Rolling phase timings, shown next to the score bar when profiling
+        self.profiler = manager.profiler
+        self.profileOverlay = None
+        if self.profiler:
+            self.profileOverlay = doodleJumpSprites.ProfileOverlay(self.profiler, \
+                                                (0, self.scoreBar.rect.bottom))
+        # The game's sprites are in world coordinates, but these stay put
+        self.hudSprites = set([self.scoreKeeper, self.scoreBar, self.pauseButton])
+        if self.profileOverlay:
+            self.hudSprites.add(self.profileOverlay)
+
+        self.state = None
+        # Whether each game's replay is written to replays/ when it ends
+        self.saveReplays = True
+
+    def enter(self, seed=None):
+        '''This method accepts an optional seed (a random one is picked
+        otherwise) and starts a new game.'''
+        # Sound Effects (shared with every other screen, and all decoded
+        # before the first game starts; this only waits if the sounds are
+        # still being preloaded)
+        self.bank.loadSounds()
+        # The game rules (doodle, 25 blue/brown/green platforms, 1 spring,
+        # 1 monster, bullets) live in the display-free simulation core
+        self.state = doodleJumpEngine.GameState(self.screen, seed, self.profiler)
+        # Every frame's inputs are recorded so the game can be replayed
+        self.recorder = doodleJumpReplay.Recorder(self.state.seed)
+
+        self.scoreKeeper.reset(0)
+        # Layers: platforms (0) are drawn under the Spring (1), which is
+        # under everything else (2), however late each sprite was added
+        self.allSprites.empty()
+        self.allSprites.add(self.state.platformGroup, layer=0)
+        self.allSprites.add(self.state.spring, layer=1)
+        self.allSprites.add(self.state.monster, self.state.doodle, self.scoreBar, \
+                            self.scoreKeeper, self.pauseButton, layer=2)
+        # Effects still showing at the end of the last game are put back
+        self.poofPool.releaseAll()
+        self.dizzinessPool.releaseAll()
+        self.effectSprites.empty()
+        self.effectSprites.add(self.scoreKeeper)
+        if self.profileOverlay:
+            self.allSprites.add(self.profileOverlay, layer=2)
+            self.effectSprites.add(self.profileOverlay)
+        self.bank.playMusic()
+
+        # A - ASSIGN
+        self.goingLeft = False
+        self.goingRight = False
+        self.shooting = False
+        self.paused = False
+        self.fullUpdate = True
+        self.dizziness = None
+        Scene.enter(self)
+
+    def resume(self):
+        '''This method redraws the whole game when the pause overlay closes.'''
+        Scene.resume(self)
+        self.fullUpdate = True
+
+    def exit(self):
+        '''This method adds the game to the score history and saves its
+        replay (seed + inputs) so the score can be verified later.'''
+        self.voices.stopLoops()
+        state = self.state
+        self.manager.scores.addRun(state.score, state.frame, state.frame / float(STEP_RATE), \
+                                   state.seed, state.causeOfDeath or "quit")
+        if not self.saveReplays:
+            return
+        if not os.path.isdir("replays"):
+            os.makedirs("replays")
+        self.recorder.save(time.strftime("replays/%Y%m%d-%H%M%S-") + \
+                           str(state.seed) + ".djr", state.score)
+
+    def handleEvent(self, event):
+        '''This method reads the left, right, up arrow keys, the space bar
+        and the pause button.'''
+        Scene.handleEvent(self, event)
+        if self.profileOverlay and (event.type == pygame.KEYDOWN) and \
+           (event.key == pygame.K_F3):
+            self.profileOverlay.visible = not self.profileOverlay.visible
+            self.profileOverlay.dirty = 1
+        # If the Doodle hits a Monster and is falling, it cannot move
+        if not self.state.hitMonster:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    self.goingLeft = True
+                elif event.key == pygame.K_RIGHT:
+                    self.goingRight = True
+                elif (event.key == pygame.K_UP) or (event.key == pygame.K_SPACE):
+                    self.shooting = True
+            elif event.type == pygame.KEYUP:
+                if event.key == pygame.K_LEFT:
+                    self.goingLeft = False
+                elif event.key == pygame.K_RIGHT:
+                    self.goingRight = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if self.pauseButton.rect.collidepoint(self.getMousePosition()):
+                    self.voices.trigger("click")
+                    # The growl would keep looping under the pause screen
+                    self.voices.stopLoops()
+                    self.paused = True
+                    self.manager.push("pause")
+
+    def update(self):
+        '''This method advances the game by one simulation step and reacts
+        to what happened.'''
+        state = self.state
+
+        # Pass the keys held down this frame to the simulation
+        inputs = 0
+        if self.goingLeft:
+            inputs |= doodleJumpEngine.INPUT_LEFT
+        if self.goingRight:
+            inputs |= doodleJumpEngine.INPUT_RIGHT
+        if self.shooting:
+            inputs |= doodleJumpEngine.INPUT_SHOOT
+        if self.paused:
+            inputs |= doodleJumpEngine.INPUT_PAUSE
+        self.shooting = False
+        self.paused = False
+        self.recorder.record(inputs)
+
+        for name, data in state.step(inputs):
+            if name == "platform":
+                # Draw the platform that came into range
+                self.allSprites.add(data, layer=0)
+            elif name == "shoot":
+                # Draw the new bullet
+                self.allSprites.add(data, layer=2)
+            elif name == "doodleHit":
+                # Stars circle the Doodle's head as it falls
+                self.dizziness = self.dizzinessPool.acquire()
+                self.dizziness.activate(state.doodle.rect.center)
+                self.allSprites.add(self.dizziness, layer=2)
+                self.effectSprites.add(self.dizziness)
+            elif name == "monsterKilled":
+                poofSprite = self.poofPool.acquire()
+                poofSprite.activate(data)
+                self.allSprites.add(poofSprite, layer=2)
+                self.effectSprites.add(poofSprite)
+
+            if name in self.voices.voices:
+                self.voices.trigger(name)
+        # Loops the step didn't ask for (eg. the growl once the Monster is
+        # shot) fade out
+        self.voices.endStep()
+
+        # If the Doodle passes the bottom of the screen, game over
+        if state.gameOver:
+            self.manager.switchTo("gameOver", score=self.scoreKeeper.getScore(), \
+                                  doodleCenterX=state.doodle.rect.centerx)
+
+        if self.dizziness:
+            # Dizziness follows the Doodle as it falls
+            self.dizziness.setPosition(state.doodle.rect.center)
+
+        self.scoreKeeper.setScore(state.score)
+        if self.profiler:
+            self.profiler.start("update")
+        self.effectSprites.update()
+        if self.profiler:
+            self.profiler.stop("update")
+
+        if SHOW_CACHE_STATS and (state.frame % 30 == 0):
+            stats = doodleJumpAssets.getCacheStats()
+            print("masks built/s: %.1f, images: %d hits, %d misses, text: %d hits, " \
+                  "%d misses" % (doodleJumpAssets.maskCache.getBuildRate(), \
+                  stats["hits"], stats["misses"], stats["textHits"], stats["textMisses"]))
+        if SHOW_POOL_STATS and (state.frame % 30 == 0):
+            for name, pool in (("bullets", state.bulletPool), ("poofs", self.poofPool), \
+                               ("dizziness", self.dizzinessPool)):
+                stats = pool.getStats()
+                print("%s pool: %d in use of %d (at most %d), reused %d times" % \
+                      (name, stats["active"], stats["size"], stats["peakActive"], \
+                       stats["reused"]))
+        if SHOW_AUDIO_STATS and (state.frame % 30 == 0):
+            stats = self.voices.getStats()
+            print("mixer calls/s: %.1f, sounds skipped: %d, loops playing: %d" % \
+                  (self.voices.getCallRate(), stats["skipped"], stats["looping"]))
+
+    def getCamera(self):
+        '''This accessor returns the world y coordinate at the top of the
+        screen.'''
+        return self.state.cameraY
+
+    def draw(self):
+        '''This method draws the frame, redrawing the whole screen when the
+        sprites scroll or the game comes back from a pause.'''
+        refreshScreen(self.allSprites, self.renderer, self.fullUpdate or self.state.scrolled, \
+                      self.profiler)
+        self.fullUpdate = False
+
+class SceneManager(object):
+    '''A class that owns the Renderer and a stack of scenes. The top scene
+    gets the events and is drawn; scenes below it (eg. the game under the
+    pause overlay) wait until it is popped.'''
+    def __init__(self, renderer, bank, scores=None):
+        '''This initializer takes the Renderer (which opened the window), the
+        resource bank and an optional ScoreStore (the one in scores/ is opened
+        otherwise) as parameters and builds every scene once.'''
+        self.renderer = renderer
+        # Scenes are laid out on a 401x620 screen, whatever the window's size
+        self.screen = renderer.canvas
+        self.bank = bank
+        if scores is None:
+            scores = doodleJumpScores.ScoreStore()
+        self.scores = scores
+        # Every scene plays its sounds through the same channel budget
+        self.voices = doodleJumpAudio.VoiceManager(bank)
+        self.clock = pygame.time.Clock()
+        # The scenes are simulated at STEP_RATE however fast frames are
+        # drawn, and sprites are drawn between their last two positions
+        self.timestep = doodleJumpTiming.FixedTimestep(STEP_RATE)
+        self.interpolator = doodleJumpTiming.Interpolator()
+        self.profiler = None
+        if PROFILE:
+            self.profiler = doodleJumpProfiler.FrameProfiler()
+        self.stack = []
+        # Scene changes wait until the end of the frame
+        self.pending = []
+        self.running = False
+        self.scenes = {"mainMenu": MainMenuScene(self), "gameOver": GameOverScene(self), \
+                       "pause": PauseScene(self), "play": PlayScene(self)}
+
+    def switchTo(self, name, **parameters):
+        '''This method accepts a scene name (and the parameters of its enter
+        method) and replaces every scene on the stack with it.'''
+        self.pending.append(("switch", name, parameters))
+
+    def push(self, name, **parameters):
+        '''This method accepts a scene name and shows it as an overlay on top
+        of the current scene.'''
+        self.pending.append(("push", name, parameters))
+
+    def pop(self):
+        '''This method closes the overlay on top and resumes the scene under it.'''
+        self.pending.append(("pop", None, {}))
+
+    def quit(self):
+        '''This method stops the manager at the end of the frame.'''
+        self.running = False
+
+    def applyPending(self):
+        '''This method carries out the scene changes asked for this frame.'''
+        pending = self.pending
+        self.pending = []
+        for action, name, parameters in pending:
+            if action == "pop":
+                self.stack.pop().exit()
+                self.stack[-1].resume()
+                continue
+            if action == "switch":
+                while self.stack:
+                    self.stack.pop().exit()
+            scene = self.scenes[name]
+            self.stack.append(scene)
+            scene.enter(**parameters)
+
+    def redraw(self):
+        '''This method shows every scene on the stack again after the window
+        changed size.'''
+        for scene in self.stack:
+            scene.show()
+            if scene is not self.stack[-1]:
+                # The scene under an overlay is drawn once, for the overlay
+                # to go over it
+                self.interpolator.apply(scene.allSprites, 1.0, scene.getCamera(), \
+                                        scene.hudSprites)
+                scene.draw()
+                self.interpolator.restore()
+
+    def runFrame(self, events, steps, alpha=0.0):
+        '''This method accepts the events of this frame, the number of
+        simulation steps to run and how far (0 to 1) the drawing is between
+        the last two steps. It runs one frame of the top scene and then any
+        scene changes it asked for.'''
+        # E - EVENT HANDLING
+        scene = self.stack[-1]
+        profiler = None
+        if scene.profiled:
+            profiler = self.profiler
+        if profiler:
+            profiler.beginFrame()
+            profiler.start("events")
+        for event in events:
+            if self.renderer.handleEvent(event):
+                self.redraw()
+            scene.handleEvent(event)
+        if profiler:
+            profiler.stop("events")
+
+        # Run the steps that are due (none if the scene is changing)
+        for step in range(steps):
+            if self.pending:
+                break
+            self.interpolator.capture(scene.allSprites, scene.getCamera())
+            scene.update()
+            if profiler:
+                profiler.countStep()
+
+        # R - REFRESH SCREEN
+        self.interpolator.apply(scene.allSprites, alpha, scene.getCamera(), \
+                                scene.hudSprites)
+        scene.draw()
+        self.interpolator.restore()
+        if profiler:
+            profiler.endFrame()
+
+        if self.pending:
+            self.applyPending()
+            # Don't catch up on the time spent loading the new scene (the
+            # clock is ticked so the next frame's time starts from here)
+            self.clock.tick()
+            self.timestep.reset()
+            self.interpolator.capture(())
+
+    def run(self, name):
+        '''This method accepts the name of the first scene and runs the game
+        loop until a scene quits.'''
+        self.switchTo(name)
+        self.applyPending()
+        # The first frame's time starts once the first scene is loaded
+        self.clock.tick()
+        self.running = True
+
+        reportTime = 0.0
+        # L - LOOP
+        while self.running:
+            # TIME
+            elapsed = self.clock.tick(MAX_FPS) / 1000.0
+            dropped = self.timestep.droppedSteps
+            steps = self.timestep.advance(elapsed)
+            if SHOW_DROPPED_STEPS and (self.timestep.droppedSteps > dropped):
+                print("frame took %d ms, skipped %d simulation steps" % \
+                      (elapsed * 1000, self.timestep.droppedSteps - dropped))
+
+            self.runFrame(pygame.event.get(), steps, self.timestep.getAlpha())
+
+            reportTime += elapsed
+            if SHOW_TIMING and (reportTime >= 1.0):
+                stats = self.timestep.getStats()
+                print("fps: %.1f, steps: %d, late frames: %d, skipped steps: %d" % \
+                      (self.clock.get_fps(), stats["steps"], stats["lateFrames"], \
+                       stats["droppedSteps"]))
+                reportTime = 0.0
+
+        while self.stack:
+            self.stack.pop().exit()
+        self.scores.close()
+
+        if self.profiler and self.profiler.frames:
+            self.saveProfile()
+
+    def saveProfile(self):
+        '''This method writes the profiler's per-frame trace to profiles/ as
+        JSON and CSV.'''
+        if not os.path.isdir("profiles"):
+            os.makedirs("profiles")
+        path = time.strftime("profiles/%Y%m%d-%H%M%S")
+        self.profiler.saveJSON(path + ".json")
+        self.profiler.saveCSV(path + ".csv")
+        print("frame profile written to " + path + ".json and " + path + ".csv")
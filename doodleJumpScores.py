@@ -0,0 +1,244 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Keeps the history of every Doodle Jump run in a local SQLite
+                database, indexed for leaderboard and percentile queries
+"""
+
+import argparse, os, sqlite3, sys, time
+
+# Where the game keeps its score history
+SCORES_PATH = os.path.join("scores", "history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    endedAt REAL NOT NULL,
+    day TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    frames INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    seed INTEGER NOT NULL,
+    cause TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runsByScore ON runs (score);
+CREATE INDEX IF NOT EXISTS runsByDay ON runs (day, score);
+CREATE TABLE IF NOT EXISTS scoreTree (
+    node INTEGER PRIMARY KEY,
+    runs INTEGER NOT NULL
+);
+"""
+
+# The all-time score counts are kept in a Fenwick tree (in the scoreTree
+# table) over buckets of BUCKET_SIZE scores, so counting the runs below a
+# score takes about log2(TREE_SIZE) lookups however many runs there are.
+# Scores past the last bucket are counted in it.
+BUCKET_SIZE = 10
+TREE_SIZE = 2 ** 17
+
+class ScoreStore(object):
+    '''A class that records every run (score, duration, seed and cause of
+    death) and answers leaderboard queries. Runs are indexed by score and by
+    (day, score), so top-K and per-day queries only walk the index instead
+    of every run. All-time counts and percentiles come from the Fenwick tree
+    of score counts (plus the index inside one bucket), so they take about
+    the same time with a hundred runs or a million.'''
+    def __init__(self, path=SCORES_PATH):
+        '''This initializer takes the path of the database file (":memory:"
+        keeps it in memory) and opens it, creating it if needed.'''
+        if (path != ":memory:") and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        # The write-ahead log lets a run be added without waiting for the
+        # whole file to be synced to disk
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        # Histories recorded before the tree existed get it built once
+        if self.connection.execute("SELECT EXISTS (SELECT 1 FROM runs)").fetchone()[0] and \
+           not self.connection.execute("SELECT EXISTS (SELECT 1 FROM scoreTree)").fetchone()[0]:
+            self.buildTree()
+
+    def buildTree(self):
+        '''This method fills the Fenwick tree from every run recorded.'''
+        tree = [0] * (TREE_SIZE + 1)
+        for bucket, runs in self.connection.execute("SELECT MIN(score / ?, ?) + 1, " \
+                                                    "COUNT(*) FROM runs GROUP BY 1", \
+                                                    (BUCKET_SIZE, TREE_SIZE - 1)):
+            tree[bucket] += runs
+        # Each node passes its count on to its parent
+        for node in range(1, TREE_SIZE + 1):
+            parent = node + (node & -node)
+            if parent <= TREE_SIZE:
+                tree[parent] += tree[node]
+        with self.connection:
+            self.connection.execute("DELETE FROM scoreTree")
+            self.connection.executemany("INSERT INTO scoreTree (node, runs) VALUES (?, ?)", \
+                                        [(node, tree[node]) for node in \
+                                         range(1, TREE_SIZE + 1) if tree[node]])
+
+    def getNode(self, node):
+        '''This method accepts a node of the Fenwick tree and returns its
+        count.'''
+        row = self.connection.execute("SELECT runs FROM scoreTree WHERE node = ?", \
+                                      (node,)).fetchone()
+        return row[0] if row else 0
+
+    def countBelowBucket(self, bucket):
+        '''This method accepts a bucket (1 to TREE_SIZE) and returns the
+        number of runs in the buckets before it.'''
+        nodes = []
+        node = bucket - 1
+        while node > 0:
+            nodes.append(node)
+            node -= node & -node
+        if not nodes:
+            return 0
+        return self.connection.execute("SELECT COALESCE(SUM(runs), 0) FROM scoreTree " \
+                                       "WHERE node IN (" + ", ".join("?" * len(nodes)) + \
+                                       ")", nodes).fetchone()[0]
+
+    def addRun(self, score, frames, seconds, seed, cause, endedAt=None):
+        '''This method accepts a run's score, number of frames, length in
+        seconds, seed, cause of death and (optionally) the time it ended,
+        and records it.'''
+        if endedAt is None:
+            endedAt = time.time()
+        # Every node of the tree covering the run's bucket counts it
+        nodes = []
+        node = getBucket(score)
+        while node <= TREE_SIZE:
+            nodes.append((node,))
+            node += node & -node
+        with self.connection:
+            self.connection.execute("INSERT INTO runs (endedAt, day, score, frames, " \
+                                    "seconds, seed, cause) VALUES (?, ?, ?, ?, ?, ?, ?)", \
+                                    (endedAt, getDay(endedAt), score, frames, seconds, \
+                                     seed, cause))
+            self.connection.executemany("INSERT INTO scoreTree (node, runs) VALUES (?, 1) " \
+                                        "ON CONFLICT (node) DO UPDATE SET runs = runs + 1", \
+                                        nodes)
+
+    def getCount(self, day=None):
+        '''This method accepts an optional day ("YYYY-MM-DD") and returns the
+        number of runs (on that day).'''
+        if day is None:
+            # (the last node of the tree covers every bucket)
+            return self.getNode(TREE_SIZE)
+        return self.connection.execute("SELECT COUNT(*) FROM runs WHERE day = ?", \
+                                       (day,)).fetchone()[0]
+
+    def getHighScore(self, day=None):
+        '''This method accepts an optional day and returns the best score (on
+        that day), or 0 when there are no runs.'''
+        if day is None:
+            row = self.connection.execute("SELECT MAX(score) FROM runs").fetchone()
+        else:
+            row = self.connection.execute("SELECT MAX(score) FROM runs WHERE day = ?", \
+                                          (day,)).fetchone()
+        return row[0] or 0
+
+    def getTopRuns(self, count=10, day=None):
+        '''This method accepts the number of runs and an optional day and
+        returns the best runs (on that day) as dictionaries, best first.'''
+        columns = "id, endedAt, day, score, frames, seconds, seed, cause"
+        if day is None:
+            cursor = self.connection.execute("SELECT " + columns + " FROM runs " \
+                                             "ORDER BY score DESC LIMIT ?", (count,))
+        else:
+            cursor = self.connection.execute("SELECT " + columns + " FROM runs " \
+                                             "WHERE day = ? ORDER BY score DESC LIMIT ?", \
+                                             (day, count))
+        names = [description[0] for description in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def getPercentile(self, score, day=None):
+        '''This method accepts a score and an optional day and returns the
+        percentage of runs (on that day) that scored less.'''
+        total = self.getCount(day)
+        if not total:
+            return 0.0
+        if day is None:
+            # The buckets below the score's, then the runs below it in its own
+            bucket = getBucket(score)
+            below = self.countBelowBucket(bucket) + \
+                self.connection.execute("SELECT COUNT(*) FROM runs WHERE score >= ? AND " \
+                                        "score < ?", ((bucket - 1) * BUCKET_SIZE, \
+                                                      score)).fetchone()[0]
+        else:
+            below = self.connection.execute("SELECT COUNT(*) FROM runs WHERE day = ? " \
+                                            "AND score < ?", (day, score)).fetchone()[0]
+        return 100.0 * below / total
+
+    def getScoreAtPercentile(self, percent, day=None):
+        '''This method accepts a percentage and an optional day and returns
+        the score that percentage of runs (on that day) are at or below.'''
+        total = self.getCount(day)
+        if not total:
+            return 0
+        offset = min(total - 1, int(total * percent / 100.0))
+        if day is None:
+            # Walk down the tree to the bucket holding the run at that offset,
+            # then find it in that bucket
+            node = 0
+            step = TREE_SIZE
+            while step:
+                if node + step <= TREE_SIZE:
+                    runs = self.getNode(node + step)
+                    if runs <= offset:
+                        node += step
+                        offset -= runs
+                step //= 2
+            row = self.connection.execute("SELECT score FROM runs WHERE score >= ? " \
+                                          "ORDER BY score LIMIT 1 OFFSET ?", \
+                                          (node * BUCKET_SIZE, offset)).fetchone()
+        else:
+            row = self.connection.execute("SELECT score FROM runs WHERE day = ? " \
+                                          "ORDER BY score LIMIT 1 OFFSET ?", \
+                                          (day, offset)).fetchone()
+        return row[0]
+
+    def close(self):
+        '''This method closes the database.'''
+        self.connection.close()
+
+def getBucket(score):
+    '''This function accepts a score and returns its bucket in the Fenwick
+    tree (1 to TREE_SIZE).'''
+    return min(max(score, 0) // BUCKET_SIZE, TREE_SIZE - 1) + 1
+
+def getDay(timestamp=None):
+    '''This function accepts an optional time (now by default) and returns
+    its local date as "YYYY-MM-DD".'''
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+def main(arguments=None):
+    '''This function prints the leaderboard and score percentiles of the
+    score history.'''
+    parser = argparse.ArgumentParser(description="Show the Doodle Jump score history.")
+    parser.add_argument("--path", default=SCORES_PATH)
+    parser.add_argument("--day", help="only runs on this day (YYYY-MM-DD, or today)")
+    parser.add_argument("--top", type=int, default=10, help="number of runs listed")
+    options = parser.parse_args(arguments)
+    if not os.path.isfile(options.path):
+        print("no score history at " + options.path)
+        return 1
+    day = options.day
+    if day == "today":
+        day = getDay()
+
+    store = ScoreStore(options.path)
+    print("%d runs%s" % (store.getCount(day), " on " + day if day else ""))
+    print("%4s %8s %8s %8s %12s  %-8s %s" % ("rank", "score", "frames", "seconds", \
+                                             "seed", "cause", "day"))
+    for rank, run in enumerate(store.getTopRuns(options.top, day), 1):
+        print("%4d %8d %8d %8.1f %12d  %-8s %s" % (rank, run["score"], run["frames"], \
+              run["seconds"], run["seed"], run["cause"], run["day"]))
+    print("percentiles: " + ", ".join("p%d %d" % (percent, \
+                                      store.getScoreAtPercentile(percent, day)) \
+                                      for percent in (50, 90, 99)))
+    store.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,175 +3,201 @@
    Description: Sprites for the Doodle Jump game
 """
 
-import pygame, random
+import pygame, random, doodleJumpAssets, doodleJumpEntities
 
-class GreenPlatform(pygame.sprite.Sprite):
+class GreenPlatform(doodleJumpEntities.EntitySprite):
     '''A sprite subclass to represent a static Green Platform sprite.'''
-    def __init__(self, screen, yCoordinate):
-        '''This initializer takes a screen surface and y coordinate as 
-        parameters. It sets the image/rect attributes and position of the 
-        Platform.'''
+    __slots__ = ("rng", "indexKey")
+    platformType = "green"
+    kind = doodleJumpEntities.GREEN
+    
+    def __init__(self, screen, yCoordinate, rng=random, xCoordinate=None, store=None):
+        '''This initializer takes a screen surface, y coordinate, an optional
+        random number generator, an optional x coordinate (a random one is
+        picked otherwise) and an optional EntityStore as parameters. It sets
+        the image/rect attributes and position of the Platform.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        doodleJumpEntities.EntitySprite.__init__(self, screen, store)
         
-        # Set the image and rect attributes
-        self.image = pygame.image.load("objects/green.png")
-        self.image = self.image.convert_alpha()
+        # Set the image, collision mask and rect attributes
+        self.image = doodleJumpAssets.loadImage("objects/green.png")
+        self.mask = doodleJumpAssets.getMask(self.image)
         self.rect = self.image.get_rect()
         
-        # Instance variable to keep track of the screen surface
-        self.window = screen
+        # Instance variable to keep track of the
+        # random number generator of the game
+        self.rng = rng
         
         # Initiate the Platform's position
-        self.reset(yCoordinate)
+        self.addEntity()
+        self.reset(yCoordinate, xCoordinate)
         
-    def reset(self, yCoordinate):
-        '''This method accepts the yCoordinate of the screen as a parameter and 
-        resets the Platform's position.'''
+    def reset(self, yCoordinate, xCoordinate=None):
+        '''This method accepts the yCoordinate of the screen and an optional
+        x coordinate as parameters and resets the Platform's position.'''
         # Determining a random x position
-        xCoordinate = random.randint(35, self.window.get_width() - 35) 
+        if xCoordinate is None:
+            xCoordinate = self.rng.randint(35, self.store.screenWidth - 35) 
         
         self.rect.center = (xCoordinate, yCoordinate)   
+        self.moveEntity()
+        # Redraw it at its new position (moving Blue Platforms
+        # are redrawn every frame anyway)
+        if self.dirty < 2:
+            self.dirty = 1
         
-class BrownPlatform(pygame.sprite.Sprite):
+class BrownPlatform(doodleJumpEntities.EntitySprite):
     '''A sprite subclass to represent a fragile Brown Platform sprite.'''
-    def __init__(self, screen, yCoordinate):
-        '''This initializer takes takes a screen surface and y coordinate as 
-        parameters. It sets the image/rect attributes and position of the 
-        Platform.'''
+    __slots__ = ("rng", "indexKey")
+    platformType = "brown"
+    kind = doodleJumpEntities.BROWN
+    # The Platform's images, whole and broken
+    images = ("objects/brown1.png", "objects/brown2.png")
+    
+    def __init__(self, screen, yCoordinate, rng=random, xCoordinate=None, store=None):
+        '''This initializer takes takes a screen surface, y coordinate, an
+        optional random number generator, an optional x coordinate and an
+        optional EntityStore as parameters. It sets the image/rect attributes
+        and position of the Platform.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        doodleJumpEntities.EntitySprite.__init__(self, screen, store)
         
-        # Load the Platform images
-        self.brown1 = pygame.image.load("objects/brown1.png")
-        self.brown2 = pygame.image.load("objects/brown2.png")
-
-        # Instance variable to keep track of the screen surface
-        self.window = screen
+        # Instance variable to keep track of the
+        # random number generator of the game
+        self.rng = rng
 
         # Initiate the Platform's image/rect attributes and position
-        self.reset(yCoordinate)
-        
-    def reset(self, yCoordinate):
-        '''This method accepts the yCoordinate of the screen as a parameter and 
-        resets the Platform's falling variables, image/rect attributes, and
-        position.'''        
-        self.isBroken = False
-        self.velocity = 0
-        
-        # Set the image and rect attributes        
-        self.image = self.brown1
-        self.image = self.image.convert_alpha()
+        self.rect = doodleJumpAssets.loadImage(self.images[0]).get_rect()
+        self.addEntity()
+        self.reset(yCoordinate, xCoordinate)
+        
+    def reset(self, yCoordinate, xCoordinate=None):
+        '''This method accepts the yCoordinate of the screen and an optional
+        x coordinate as parameters and resets the Platform's falling
+        variables (its animation frame and velocity in the store),
+        image/rect attributes, and position.'''        
+        self.frame = 0
+        self.dy = 0
+        
+        # Set the image, collision mask and rect attributes        
+        self.image = doodleJumpAssets.loadImage(self.images[0])
+        self.mask = doodleJumpAssets.getMask(self.image)
         self.rect = self.image.get_rect()
         
         # Determining a random x position
-        xCoordinate = random.randint(35, self.window.get_width() - 35) 
+        if xCoordinate is None:
+            xCoordinate = self.rng.randint(35, self.store.screenWidth - 35) 
         
         self.rect.center = (xCoordinate, yCoordinate)           
+        self.moveEntity()
+        self.dirty = 1
     
     def platformBreaks(self):
-        '''This method will initiate the Platform's fall.'''
-        self.image = self.brown2
-        self.image = self.image.convert_alpha()
-        self.isBroken = True        
-        
-    def update(self):
-        '''This method will automatically be called to update the Platform
-        sprite's position.'''
-        if self.isBroken:
-            self.rect.centery += self.velocity
-            # Velocity increases as the Platform falls                                    
-            self.velocity += 1              
+        '''This method will initiate the Platform's fall (the store moves
+        it from then on).'''
+        self.image = doodleJumpAssets.loadImage(self.images[1])
+        self.mask = doodleJumpAssets.getMask(self.image)
+        self.store.startFalling(self.index)
+        self.dirty = 1
             
 class BluePlatform(GreenPlatform):
     '''A sprite subclass to represent a moving Blue Platform sprite.'''
-    def __init__(self, screen, yCoordinate):
-        '''This initializer takes a screen surface and y coordinate as 
-        parameters. It sets the image/rect attributes and position of the 
-        Platform.'''
+    __slots__ = ()
+    platformType = "blue"
+    kind = doodleJumpEntities.BLUE
+    
+    def __init__(self, screen, yCoordinate, rng=random, xCoordinate=None, store=None):
+        '''This initializer takes a screen surface, y coordinate, an optional
+        random number generator, an optional x coordinate and an optional
+        EntityStore as parameters. It sets the image/rect attributes and
+        position of the Platform.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        doodleJumpEntities.EntitySprite.__init__(self, screen, store)
+        # Redraw it every frame since it is always moving
+        self.dirty = 2
         
-        # Set the image and rect attributes
-        self.image = pygame.image.load("objects/blue.png")
-        self.image = self.image.convert_alpha()
+        # Set the image, collision mask and rect attributes
+        self.image = doodleJumpAssets.loadImage("objects/blue.png")
+        self.mask = doodleJumpAssets.getMask(self.image)
         self.rect = self.image.get_rect()
         
-        # Instance variables to keep track of the screen
-        # surface and set the initial x direction
-        self.window = screen 
-        self.dx = 3
+        # Instance variable to keep track of the random number generator,
+        # and set the initial x direction (the store slides the Platform
+        # and turns it around at the sides of the screen)
+        self.rng = rng
+        self.addEntity(dx=3)
         
         # Initiate the Platform's position using the 
         # reset method inherited from the Green Platform
-        self.reset(yCoordinate)        
-        
-    def update(self):
-        '''This method will automatically be called to update the Platform
-        sprite's position.'''
-        self.rect.centerx += self.dx
-        # Reverse the x direction if the Platform hits the sides of the screen
-        if (self.rect.left < 0) or (self.rect.right > self.window.get_width()):
-            self.dx = -self.dx
+        self.reset(yCoordinate, xCoordinate)        
             
-class Spring(pygame.sprite.Sprite):
+class Spring(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent a Spring sprite.'''
-    def __init__(self, platforms):
-        '''This initializer takes a list of platforms as a parameter. It sets
-        the image/rect attributes and position of the Spring.'''
+    def __init__(self, platforms, rng=random):
+        '''This initializer takes a list of platforms and an optional random
+        number generator as parameters. It sets the image/rect attributes and
+        position of the Spring.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)  
+        pygame.sprite.DirtySprite.__init__(self)  
         
         # Load the Spring images
-        self.spring1 = pygame.image.load("objects/spring1.png")
-        self.spring2 = pygame.image.load("objects/spring2.png")   
+        self.spring1 = doodleJumpAssets.loadImage("objects/spring1.png")
+        self.spring2 = doodleJumpAssets.loadImage("objects/spring2.png")   
         
+        self.rng = rng
         self.reset(platforms)
 
     def changeImage(self):
         '''This method changes the spring image.'''
         self.image = self.spring2
-        self.image = self.image.convert_alpha()        
+        self.dirty = 1
         
-    def reset(self, platforms):
-        '''This method accepts a list of platforms as a paramter and 
-        resets the Spring's image/rect attributes and position.'''         
+    def reset(self, platforms, top=0):
+        '''This method accepts a list of platforms and the y coordinate of
+        the top of the screen as paramters and resets the Spring's image/rect
+        attributes and position.'''         
         # Set the image and rect attributes        
         self.image = self.spring1
-        self.image = self.image.convert_alpha()
         self.rect = self.image.get_rect()
         
         # Making sure the Spring only appears higher up on the screen
-        index = 0
-        while platforms[index].rect.top >= 0:
-            index = random.randint(0, len(platforms) - 1)
+        # (or on the highest Platform, if none is above the screen yet)
+        candidates = [platform for platform in platforms if platform.rect.top < top]
+        if candidates:
+            platform = self.rng.choice(candidates)
+        else:
+            platform = min(platforms, key=lambda platform: platform.rect.top)
             
         # Placing the Spring on the chosen Platform
-        xLocation = random.randint(-10, 10)
-        self.rect.centerx = platforms[index].rect.centerx + xLocation
-        self.rect.bottom = platforms[index].rect.top + 5
+        xLocation = self.rng.randint(-10, 10)
+        self.rect.centerx = platform.rect.centerx + xLocation
+        self.rect.bottom = platform.rect.top + 5
+        self.dirty = 1
   
-class Monster(pygame.sprite.Sprite):
+class Monster(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent a Monster sprite.'''
-    def __init__(self, screen, yCoordinate):
-        '''This initializer takes a screen surface and y coordinate as
-        parameters. It sets the image/rect attributes and position of the 
-        Monster.'''
+    # Store the different monster in tuples categorized
+    # by whether they have one or two images
+    singleImages = ("monsters/big_blue.png", "monsters/big_green.png", \
+                    "monsters/red.png")
+    doubleImages = (("monsters/alien_down.png", "monsters/alien_up.png"), \
+                    ("monsters/alien2_green.png", "monsters/alien2_red.png"), \
+                    ("monsters/green_yellow_eyed.png", "monsters/green_red_eyed.png"), \
+                    ("monsters/winged_down.png", "monsters/winged_up.png"))
+    
+    def __init__(self, screen, yCoordinate, rng=random):
+        '''This initializer takes a screen surface, y coordinate and an optional
+        random number generator as parameters. It sets the image/rect 
+        attributes and position of the Monster.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)    
-        
-        # Store the different monster in tuples categorized
-        # by whether they have one or two images
-        self.singleImages = ("monsters/big_blue.png", "monsters/big_green.png", \
-                            "monsters/red.png")
-        self.doubleImages = (("monsters/alien_down.png", "monsters/alien_up.png"), \
-                       ("monsters/alien2_green.png", "monsters/alien2_red.png"), \
-                       ("monsters/green_yellow_eyed.png", "monsters/green_red_eyed.png"), \
-                       ("monsters/winged_down.png", "monsters/winged_up.png"))
-        
-        # Instance variables to keep track of the screen 
-        # surface and set initial integer variables
+        pygame.sprite.DirtySprite.__init__(self)    
+        # Redraw it every frame since it is always moving
+        self.dirty = 2
+        
+        # Instance variables to keep track of the screen surface and
+        # random number generator, and set initial integer variables
         self.window = screen
+        self.rng = rng
         self.switchTime = 0
         self.velocity = -5
         self.dx = 5      
@@ -183,21 +209,21 @@ class Monster(pygame.sprite.Sprite):
         '''This method accepts the y coordinate of the screen as a parameter and 
         resets the Monster's images and position.'''
         # Determining a random image number
-        self.imageNum = random.randint(1, 2)
+        self.imageNum = self.rng.randint(1, 2)
         # Determining a random index to get a random monster
-        self.index = random.randint(0, self.imageNum + 1)   
+        self.index = self.rng.randint(0, self.imageNum + 1)   
         # Determining a random x position
-        xCoordinate = random.randint(50, self.window.get_width() - 50) 
+        xCoordinate = self.rng.randint(50, self.window.get_width() - 50) 
         # Set the monster higher up off the screen
-        yCoordinate -= random.randint(1500, 2000)    
+        yCoordinate -= self.rng.randint(1500, 2000)    
         
-        # Set image and rect attributes
+        # Set image, collision mask and rect attributes
         if self.imageNum == 1:
-            self.image = pygame.image.load(self.singleImages[self.index])
+            self.image = doodleJumpAssets.loadImage(self.singleImages[self.index])
         else:
             # For monsters with two images, set it to the first one for now
-            self.image = pygame.image.load(self.doubleImages[self.index][0])
-        self.image = self.image.convert_alpha() 
+            self.image = doodleJumpAssets.loadImage(self.doubleImages[self.index][0])
+        self.mask = doodleJumpAssets.getMask(self.image)
         self.rect = self.image.get_rect()   
         self.rect.center = (xCoordinate, yCoordinate)        
         
@@ -207,10 +233,10 @@ class Monster(pygame.sprite.Sprite):
         # Monster will continually switch images if it has double images        
         if self.imageNum == 2:
             if self.switchTime % 14 == 0:
-                self.image = pygame.image.load(self.doubleImages[self.index][1])
+                self.image = doodleJumpAssets.loadImage(self.doubleImages[self.index][1])
             elif self.switchTime % 7 == 0:
-                self.image = pygame.image.load(self.doubleImages[self.index][0])
-            self.image = self.image.convert_alpha() 
+                self.image = doodleJumpAssets.loadImage(self.doubleImages[self.index][0])
+            self.mask = doodleJumpAssets.getMask(self.image)
             self.switchTime += 1            
      
         # Monster will be "boucing" up and down as it moves left and right
@@ -227,50 +253,124 @@ class Monster(pygame.sprite.Sprite):
         if (self.rect.left < 0) or (self.rect.right > self.window.get_width()):
             self.dx = -self.dx
             
-class Poof(pygame.sprite.Sprite):
+class SpritePool(object):
+    '''A class that keeps preallocated sprites of one kind, so they can be
+    reactivated and put back instead of being built and thrown away.'''
+    def __init__(self, factory, size):
+        '''This initializer takes a function that builds a new (inactive)
+        sprite and the number of sprites to build up front.'''
+        self.factory = factory
+        self.free = []
+        # The sprites in use (a dictionary keeps the order they were taken
+        # in and finds or removes one in O(1))
+        self.active = {}
+        self.created = 0
+        self.reused = 0
+        self.peakActive = 0
+        for spriteNum in range(size):
+            self.free.append(self.build())
+            
+    def build(self):
+        '''This method builds one more sprite for the pool.'''
+        sprite = self.factory()
+        sprite.pool = self
+        self.created += 1
+        return sprite
+    
+    def acquire(self):
+        '''This method returns a free sprite (building one only when they
+        are all in use). The caller activates it.'''
+        if self.free:
+            sprite = self.free.pop()
+            self.reused += 1
+        else:
+            sprite = self.build()
+        self.active[sprite] = None
+        self.peakActive = max(self.peakActive, len(self.active))
+        return sprite
+    
+    def release(self, sprite):
+        '''This method takes a sprite out of every group and puts it back
+        in the pool.'''
+        sprite.kill()
+        if sprite in self.active:
+            del self.active[sprite]
+            self.free.append(sprite)
+            
+    def releaseAll(self):
+        '''This method puts every sprite in use back in the pool.'''
+        for sprite in list(self.active):
+            self.release(sprite)
+            
+    def getStats(self):
+        '''This method returns a dictionary of the pool's size, the sprites
+        in use (now and at most) and how many times a sprite was reused.'''
+        return {"size": self.created, "active": len(self.active), \
+                "peakActive": self.peakActive, "reused": self.reused}
+
+class Poof(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent a Poof sprite (when Monster is shot).'''
-    def __init__(self, position):
+    images = tuple("poof/poof" + str(imageNum) + ".png" for imageNum in range(8))
+    # The SpritePool it goes back to when the animation ends (if any)
+    pool = None
+    
+    def __init__(self, position=(0, 0)):
         '''This initializer takes a position tuple as a parameter. It sets the 
         image/rect attributes and position of the Poof.'''        
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)  
-        
+        pygame.sprite.DirtySprite.__init__(self)  
+        # Redraw it every frame since it is always moving
+        self.dirty = 2
+        self.activate(position)
+        
+    def activate(self, position):
+        '''This method accepts a position tuple and starts the animation
+        there (when the Poof is reused).'''
         # Set the image and rect attributes for the Poof
-        self.image = pygame.image.load("poof/poof0.png")
+        self.image = doodleJumpAssets.loadImage(self.images[0])
         self.rect = self.image.get_rect()
         self.rect.center = position
  
         self.imageNum = 0
+        
+    def deactivate(self):
+        '''This method takes the Poof off the screen (and back to its pool).'''
+        if self.pool:
+            self.pool.release(self)
+        else:
+            self.kill()
              
     def update(self):
         '''This method will be called automatically to reposition the Poof 
         sprite on the screen.'''
         # Load the images of the Poof
-        self.image = pygame.image.load("poof/poof" + str(self.imageNum) + ".png")
+        self.image = doodleJumpAssets.loadImage(self.images[self.imageNum])
         self.imageNum += 1
         
         # After all the images are loaded, it dies
         if self.imageNum == 8:
-            self.kill()        
+            self.deactivate()
         
-class Doodle(pygame.sprite.Sprite):
+class Doodle(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent a Doodle sprite.'''
     def __init__(self, screen, position, velocity):
         '''This initializer takes a screen surface, position tuple, and starting
         velocity as parameters. It sets the image/rect attributes and jumping 
         abilities of the Doodle.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        pygame.sprite.DirtySprite.__init__(self)
+        # Redraw it every frame since it is always moving
+        self.dirty = 2
          
         # Store the Doodle images in a tuple
         self.doodleImages = (("objects/left_face.png", "objects/left_jump.png"), \
                             ("objects/right_face.png", "objects/right_jump.png"), \
                             ("objects/shoot_face.png", "objects/shoot_jump.png"))
              
-        # Set image and rect attributes
+        # Set image, collision mask and rect attributes
         # Make the Doodle face the right side to start off
-        self.image = pygame.image.load(self.doodleImages[1][0])
-        self.image = self.image.convert_alpha() 
+        self.image = doodleJumpAssets.loadImage(self.doodleImages[1][0])
+        self.mask = doodleJumpAssets.getMask(self.image)
         self.rect = self.image.get_rect()   
         self.rect.center = position
         
@@ -282,6 +382,19 @@ class Doodle(pygame.sprite.Sprite):
         self.shootingTime = 0        
         self.velocity = velocity
         
+    def reset(self, position, velocity):
+        '''This method accepts a position tuple and starting velocity as
+        parameters and puts the Doodle back at the start (eg. when a screen is
+        shown again).'''
+        self.image = doodleJumpAssets.loadImage(self.doodleImages[1][0])
+        self.mask = doodleJumpAssets.getMask(self.image)
+        self.rect = self.image.get_rect()
+        self.rect.center = position
+        self.index = 1
+        self.index2 = 0
+        self.shootingTime = 0
+        self.velocity = velocity
+        
     def goLeft(self):
         '''This method will make the Doodle go left once and set the Doodle's 
         face to the left by changing the index of the tuple it refers to.'''   
@@ -324,8 +437,8 @@ class Doodle(pygame.sprite.Sprite):
         '''This method will be called automatically to reposition the Doodle 
         sprite on the screen.'''
         # Set the Doodle's faces (left, right, up) and position (jump or not)
-        self.image = pygame.image.load(self.doodleImages[self.index][self.index2])
-        self.image = self.image.convert_alpha()    
+        self.image = doodleJumpAssets.loadImage(self.doodleImages[self.index][self.index2])
+        self.mask = doodleJumpAssets.getMask(self.image)
             
         # If the Doodle is still shooting, do not reset it's position yet
         if self.shootingTime:
@@ -358,52 +471,80 @@ class Doodle(pygame.sprite.Sprite):
         elif self.rect.left > self.window.get_width():
             self.rect.centerx = 0     
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(doodleJumpEntities.EntitySprite):
     '''A sprite subclass to represent a Bullet sprite.'''
-    def __init__(self, screen, xCoordinate, yCoordinate):
-        '''This initializer takes a screen surface, x, and y coordinate as 
-        parameters. It sets the image/rect attributes and position of the 
-        Bullet.'''
+    __slots__ = ("pool",)
+    kind = doodleJumpEntities.BULLET
+    
+    def __init__(self, screen, xCoordinate=0, yCoordinate=0, store=None):
+        '''This initializer takes a screen surface, x, and y coordinate and an
+        optional EntityStore as parameters. It sets the image/rect attributes
+        and position of the Bullet.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
-        
-        # Set the image and rect attributes
-        self.image = pygame.image.load("objects/bullet.png")
-        self.image = self.image.convert_alpha()
+        doodleJumpEntities.EntitySprite.__init__(self, screen, store)
+        # Redraw it every frame since it is always moving
+        self.dirty = 2
+        # The SpritePool it goes back to when it dies (if any)
+        self.pool = None
+        
+        # Set the image, collision mask and rect attributes
+        self.image = doodleJumpAssets.loadImage("objects/bullet.png")
+        self.mask = doodleJumpAssets.getMask(self.image)
         self.rect = self.image.get_rect()
+        
+        # Set the y direction (the store moves the Bullet up the
+        # screen until it touches the top, where it dies)
+        self.addEntity(dy=-20)
+        self.activate(xCoordinate, yCoordinate)
+        
+    def activate(self, xCoordinate, yCoordinate):
+        '''This method accepts the x and y coordinate the Bullet is fired
+        from (when the Bullet is reused).'''
         self.rect.centerx = xCoordinate
         self.rect.top = yCoordinate
+        self.moveEntity()
         
-        # Instance variables to keep track of the screen
-        # surface and set the initial y direction
-        self.window = screen 
-        self.dy = -20
-        
-    def update(self):
-        '''This method will be called automatically to reposition the Bullet 
-        sprite on the screen.'''  
-        self.rect.centery += self.dy
-
-        # If the bullet touches the top of the screen, it dies
-        if self.rect.top <= 0:
+    def deactivate(self):
+        '''This method takes the Bullet off the screen (and back to its pool).'''
+        self.stopEntity()
+        if self.pool:
+            self.pool.release(self)
+        else:
             self.kill()
             
-class Dizziness(pygame.sprite.Sprite):
+class Dizziness(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent dizziness (for the Doodle).'''
-    def __init__(self, position):
+    images = ("objects/dizzy0.png", "objects/dizzy1.png", "objects/dizzy2.png")
+    # The SpritePool it goes back to when the game ends (if any)
+    pool = None
+    
+    def __init__(self, position=(0, 0)):
         '''This initializer takes a position tuple as a parameter and sets 
         the objects/rect attributes of the Dizziness.'''   
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
-        
+        pygame.sprite.DirtySprite.__init__(self)
+        # Redraw it every frame since it is always moving
+        self.dirty = 2
+        self.activate(position)
+        
+    def activate(self, position):
+        '''This method accepts a position tuple and starts the stars there
+        (when the Dizziness is reused).'''
         # Set the image and rect attributes
-        self.image = pygame.image.load("objects/dizzy0.png")
-        self.image = self.image.convert_alpha()
+        self.image = doodleJumpAssets.loadImage(self.images[0])
         self.rect = self.image.get_rect()
         
         self.imageNum = 0
         self.setPosition(position)
         
+    def deactivate(self):
+        '''This method takes the Dizziness off the screen (and back to its
+        pool).'''
+        if self.pool:
+            self.pool.release(self)
+        else:
+            self.kill()
+        
     def setPosition(self, position):
         '''This mutator sets the position of the Dizziness (follows Doodle).'''
         self.rect.centerx = position[0]
@@ -414,39 +555,41 @@ class Dizziness(pygame.sprite.Sprite):
         the Dizziness on the Doodle.'''   
         # Images change to make it look like the stars go in a circle
         self.imageNum += 1
-        self.image = pygame.image.load("objects/dizzy" + str(self.imageNum % 3) + ".png")
-        self.image = self.image.convert_alpha()
+        self.image = doodleJumpAssets.loadImage(self.images[self.imageNum % 3])
         
-class ScoreBar(pygame.sprite.Sprite):
+class ScoreBar(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent a static, translucent score bar.'''
     def __init__(self):
         '''This initializer sets the image/rect attributes of the score bar
         and makes it translucent.'''   
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        pygame.sprite.DirtySprite.__init__(self)
         
         # Set the image and rect attributes
-        self.image = pygame.image.load("backgrounds/score_bar.png")
-        self.image = self.image.convert()
-        # This makes the image translucent
+        self.image = doodleJumpAssets.loadImage("backgrounds/score_bar.png", "opaque")
+        # This makes the image translucent (the shared surface is
+        # only ever used translucent, so setting it again is harmless)
         self.image.set_alpha(150)        
         self.rect = self.image.get_rect()  
         
-class ScoreKeeper(pygame.sprite.Sprite):
+class ScoreKeeper(pygame.sprite.DirtySprite):
     '''This class defines a label sprite to display the score.'''
     def __init__(self, string, score, xCoordinate, yCoordinate):
         '''This initializer takes a string, score, x, and y coordinate as 
-        parameters. It loads the custom font "doodle_jump_font.ttf", and sets 
-        the starting word (if applicable), score, and position.'''
+        parameters. It sets the starting word (if applicable), score, and
+        position.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        pygame.sprite.DirtySprite.__init__(self)
  
-        # Load custom font, and initialize the starting word, score, and position
-        self.font = pygame.font.Font("doodle_jump_font.ttf", 30)
+        # Initialize the starting word, score, and position (the label is
+        # drawn with the custom font "doodle_jump_font.ttf" from the text cache)
         self.string = string
         self.score = score
+        self.renderedScore = None
         self.xCoordinate = xCoordinate
         self.yCoordinate = yCoordinate
+        # Render it now, since it can be drawn before it is first updated
+        self.update()
          
     def getScore(self):
         '''This accessor returns the integer variable: self.score, which
@@ -457,28 +600,96 @@ class ScoreKeeper(pygame.sprite.Sprite):
         '''This mutator accepts an integer score as a parameter. If this score
         is greater than self.score, self.score is set to this score.'''
         self.score = max(self.score, score)
+        
+    def reset(self, score):
+        '''This mutator accepts an integer score as a parameter and sets
+        self.score to it (eg. for a new game).'''
+        self.score = score
      
     def update(self):
-        '''This method will be called automatically to display the current score.'''
-        self.image = self.font.render(self.string + str(self.score), 1, (0, 0, 0))
+        '''This method will be called automatically to display the current
+        score. The label is only put together again when the score changed.'''
+        if self.score == self.renderedScore:
+            return
+        self.image = doodleJumpAssets.renderNumber("doodle_jump_font.ttf", 30, \
+                                                   self.string, self.score)
         self.rect = self.image.get_rect()
         self.rect.left = self.xCoordinate
         self.rect.top = self.yCoordinate
-        
-class Button(pygame.sprite.Sprite):
+        self.renderedScore = self.score
+        self.dirty = 1
+        
+class Label(pygame.sprite.DirtySprite):
+    '''This class defines a sprite to display a line of text.'''
+    def __init__(self, text, position, size=20):
+        '''This initializer takes a string, the topleft position tuple and
+        an optional font size as parameters.'''
+        # Call the parent __init__() method
+        pygame.sprite.DirtySprite.__init__(self)
+        self.text = None
+        self.position = position
+        self.size = size
+        self.setText(text)
+
+    def setText(self, text):
+        '''This mutator accepts a string and shows it (the text is only
+        rendered again when it changed).'''
+        if text == self.text:
+            return
+        self.text = text
+        self.image = doodleJumpAssets.renderText("doodle_jump_font.ttf", self.size, text)
+        self.rect = self.image.get_rect(topleft=self.position)
+        self.dirty = 1
+
+class Button(pygame.sprite.DirtySprite):
     '''A sprite subclass to represent a static Button sprite.'''
     def __init__(self, index, position):
         '''This initializer takes an index and position tuple as parameters. It 
         sets the image/rect attributes and position of the Button.'''
         # Call the parent __init__() method
-        pygame.sprite.Sprite.__init__(self)
+        pygame.sprite.DirtySprite.__init__(self)
         
         # Store the Button images in a tuple to be accessed by index
         self.buttons = ("buttons/play.png", "buttons/play_again.png", \
                         "buttons/menu.png", "buttons/pause.png", "buttons/resume.png")   
         
         # Set the image and rect attributes
-        self.image = pygame.image.load(self.buttons[index])
-        self.image = self.image.convert_alpha()  
+        self.image = doodleJumpAssets.loadImage(self.buttons[index])
+        self.rect = self.image.get_rect()
+        self.rect.center = position
+
+class ProfileOverlay(pygame.sprite.DirtySprite):
+    '''A sprite subclass to display the frame profiler's rolling timings.'''
+    def __init__(self, profiler, position):
+        '''This initializer takes a FrameProfiler and the topleft position
+        tuple as parameters and renders the current timings.'''
+        # Call the parent __init__() method
+        pygame.sprite.DirtySprite.__init__(self)
+        
+        self.profiler = profiler
+        self.position = position
+        self.steps = 0
+        self.render()
+        
+    def render(self):
+        '''This method draws a translucent table of each phase's p50 and p99
+        times (in milliseconds) over the recent frames.'''
+        rows = [("phase", "p50", "p99")]
+        for phase, median, slowest in self.profiler.getSummary():
+            rows.append((phase, "%.2f" % median, "%.2f" % slowest))
+        self.image = pygame.Surface((150, len(rows) * 15 + 6), pygame.SRCALPHA)
+        self.image.fill((255, 255, 255, 180))
+        for rowNum, row in enumerate(rows):
+            for columnNum, text in enumerate(row):
+                label = doodleJumpAssets.renderText("doodle_jump_font.ttf", 14, text)
+                self.image.blit(label, (4 + columnNum * 55, 3 + rowNum * 15))
         self.rect = self.image.get_rect()
-        self.rect.center = position
\ No newline at end of file
+        self.rect.topleft = self.position
+        self.dirty = 1
+        
+    def update(self):
+        '''This method will be called automatically every simulation step
+        and renders the timings again twice a second.'''
+        self.steps += 1
+        if self.steps % 15 == 0:
+            self.render()
@@ -0,0 +1,121 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Runs the Doodle Jump simulation at a fixed rate and draws
+                sprites between their simulated positions
+"""
+
+class FixedTimestep(object):
+    '''A class that turns the real time between drawn frames into a whole
+    number of fixed-length simulation steps. The time left over is kept for
+    the next frame and tells how far the drawing is between two steps.'''
+    def __init__(self, stepRate=30, maxSteps=5):
+        '''This initializer takes the number of simulation steps per second
+        and the most steps to run for one drawn frame (so a long hiccup
+        doesn't make the game run in fast forward to catch up).'''
+        self.stepTime = 1.0 / stepRate
+        self.maxSteps = maxSteps
+        self.accumulator = 0.0
+        self.frames = 0
+        self.steps = 0
+        self.lateFrames = 0
+        self.droppedSteps = 0
+
+    def advance(self, elapsed):
+        '''This method accepts the seconds since the last drawn frame and
+        returns how many simulation steps to run before drawing this one.'''
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.stepTime)
+        self.frames += 1
+        if steps > 1:
+            # The frame ran late, so the simulation catches up
+            self.lateFrames += 1
+        if steps > self.maxSteps:
+            # Too far behind to catch up; those steps are skipped
+            self.droppedSteps += steps - self.maxSteps
+            self.accumulator -= (steps - self.maxSteps) * self.stepTime
+            steps = self.maxSteps
+        self.accumulator -= steps * self.stepTime
+        self.steps += steps
+        return steps
+
+    def getAlpha(self):
+        '''This accessor returns how far (0 to 1) the next drawn frame is
+        between the last two simulation steps.'''
+        return min(self.accumulator / self.stepTime, 1.0)
+
+    def reset(self):
+        '''This method forgets the time left over (eg. after loading a new
+        screen, which shouldn't be caught up on).'''
+        self.accumulator = 0.0
+
+    def getStats(self):
+        '''This accessor returns a dictionary of the frame and step counters.'''
+        return {"frames": self.frames, "steps": self.steps, \
+                "lateFrames": self.lateFrames, "droppedSteps": self.droppedSteps}
+
+class Interpolator(object):
+    '''A class that moves sprites from where the simulation keeps them to
+    where they are drawn while the frame is drawn, then puts them back.
+    Sprites are drawn between their positions before and after the last
+    simulation step, relative to the camera (also drawn between its last
+    two positions).'''
+    def __init__(self, maxDistance=100):
+        '''This initializer takes the largest move (in pixels) that is
+        smoothed; anything further is a jump (eg. a platform reset to the top)
+        and is drawn where it landed.'''
+        self.maxDistance = maxDistance
+        self.previous = {}
+        self.previousCamera = 0
+        self.moved = []
+        # The camera's position when the last frame was drawn
+        self.drawnCamera = 0
+
+    def capture(self, sprites, camera=0):
+        '''This method accepts the sprites about to be simulated and the
+        camera's y coordinate, and stores where they are.'''
+        self.previous = dict((sprite, sprite.rect.topleft) for sprite in sprites)
+        self.previousCamera = camera
+
+    def apply(self, sprites, alpha, camera=0, fixed=()):
+        '''This method accepts the sprites about to be drawn, how far (0 to
+        1) the frame is between the last two steps, the camera's y coordinate
+        and the sprites drawn without the camera. It moves each sprite that
+        many parts of the way from its previous position, and then up by the
+        camera's position (moved the same way).'''
+        cameraMove = camera - self.previousCamera
+        if abs(cameraMove) <= self.maxDistance:
+            camera = self.previousCamera + int(round(cameraMove * alpha))
+        # When the camera moves, everything it shows moves on the screen
+        cameraMoved = camera != self.drawnCamera
+        self.drawnCamera = camera
+        previousPositions = self.previous
+        maxDistance = self.maxDistance
+        moved = self.moved
+        for sprite in sprites:
+            rect = sprite.rect
+            x, y = position = rect.topleft
+            previous = previousPositions.get(sprite)
+            interpolated = False
+            if (previous is not None) and (previous != position):
+                dx = x - previous[0]
+                dy = y - previous[1]
+                if (abs(dx) <= maxDistance) and (abs(dy) <= maxDistance):
+                    x = previous[0] + int(round(dx * alpha))
+                    y = previous[1] + int(round(dy * alpha))
+                    interpolated = True
+            if sprite not in fixed:
+                y -= camera
+                interpolated = interpolated or cameraMoved
+            if (x, y) != position:
+                moved.append((sprite, position))
+                rect.topleft = (x, y)
+            # It has to be redrawn every frame until it gets there
+            if interpolated and not sprite.dirty:
+                sprite.dirty = 1
+
+    def restore(self):
+        '''This method puts the sprites moved by apply back where the
+        simulation left them.'''
+        for sprite, position in self.moved:
+            sprite.rect.topleft = position
+        self.moved = []
@@ -0,0 +1,168 @@
+"""Author: Jennifer Cao
+   Date: Sun, Oct 18th, 2026
+   Description: Runs headless Doodle Jump games for bot policies on every core
+"""
+
+import argparse, random, statistics, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import doodleJumpEngine
+
+def idlePolicy(state, rng):
+    '''This policy never presses anything (the Doodle just bounces).'''
+    return 0
+
+def randomPolicy(state, rng):
+    '''This policy presses a random combination of keys every frame.'''
+    inputs = rng.choice((0, doodleJumpEngine.INPUT_LEFT, doodleJumpEngine.INPUT_RIGHT))
+    if rng.random() < 0.05:
+        inputs |= doodleJumpEngine.INPUT_SHOOT
+    return inputs
+
+def zigzagPolicy(state, rng):
+    '''This policy alternates between going left and right every 40 frames
+    and shoots once a second.'''
+    if (state.frame // 40) % 2:
+        inputs = doodleJumpEngine.INPUT_RIGHT
+    else:
+        inputs = doodleJumpEngine.INPUT_LEFT
+    if state.frame % 30 == 0:
+        inputs |= doodleJumpEngine.INPUT_SHOOT
+    return inputs
+
+def climberPolicy(state, rng):
+    '''This policy steers the Doodle towards the nearest platform it can land
+    on and shoots at the Monster when it is right above.'''
+    doodle = state.doodle.rect
+    inputs = 0
+
+    # Shoot the Monster if it is above the Doodle and horizontally close
+    monster = state.monster.rect
+    if (monster.bottom < doodle.top) and (abs(monster.centerx - doodle.centerx) < 30):
+        inputs |= doodleJumpEngine.INPUT_SHOOT
+
+    # Aim for the closest platform below the Doodle's feet (while falling)
+    # or the lowest one above them (while still jumping)
+    target = None
+    for platform in state.platformGroup:
+        if state.doodle.getVelocity() > 0:
+            distance = platform.rect.top - doodle.bottom
+        else:
+            distance = doodle.bottom - platform.rect.top
+        if (distance >= 0) and ((target is None) or (distance < target[0])):
+            target = (distance, platform.rect.centerx)
+
+    if target is not None:
+        if target[1] < doodle.centerx - 5:
+            inputs |= doodleJumpEngine.INPUT_LEFT
+        elif target[1] > doodle.centerx + 5:
+            inputs |= doodleJumpEngine.INPUT_RIGHT
+    return inputs
+
+# Policies selectable from the command line
+POLICIES = {"idle": idlePolicy, "random": randomPolicy, "zigzag": zigzagPolicy, \
+            "climber": climberPolicy}
+
+def playEpisodes(policyName, seeds, maxFrames):
+    '''This function runs in a worker process. It accepts a policy name, a
+    list of seeds and a frame limit as parameters, plays one headless game
+    per seed and returns a list of result dictionaries.'''
+    policy = POLICIES[policyName]
+    results = []
+    for seed in seeds:
+        # The level and the policy both get their randomness from the seed
+        rng = random.Random(seed)
+        startTime = time.perf_counter()
+        state = doodleJumpEngine.runGame(lambda state: policy(state, rng), \
+                                         maxFrames, seed)
+        results.append({"policy": policyName, "seed": seed, "score": state.score, \
+                        "frames": state.frame, \
+                        "cause": state.causeOfDeath or "timeout", \
+                        "seconds": time.perf_counter() - startTime})
+    return results
+
+def parseSeeds(text):
+    '''This function accepts a seed list such as "0-99" or "1,5,9" and
+    returns the list of integer seeds.'''
+    seeds = []
+    for part in text.split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            seeds.extend(range(int(first), int(last) + 1))
+        else:
+            seeds.append(int(part))
+    return seeds
+
+def summarize(results, policyNames):
+    '''This function accepts the list of result dictionaries and the policy
+    names as parameters and returns the lines of the summary table.'''
+    lines = ["%-10s %8s %9s %9s %8s %10s %6s %8s %8s" % ("policy", "episodes", \
+             "mean", "median", "max", "frames", "fell", "monster", "timeout")]
+    for policyName in policyNames:
+        episodes = [result for result in results if result["policy"] == policyName]
+        if not episodes:
+            continue
+        scores = [episode["score"] for episode in episodes]
+        causes = [episode["cause"] for episode in episodes]
+        lines.append("%-10s %8d %9.1f %9.1f %8d %10.1f %6d %8d %8d" % (policyName, \
+                     len(episodes), statistics.mean(scores), statistics.median(scores), \
+                     max(scores), statistics.mean(episode["frames"] for episode in episodes), \
+                     causes.count("fell"), causes.count("monster"), \
+                     causes.count("timeout")))
+    return lines
+
+def main(arguments=None):
+    '''This function parses the command line, spreads the episodes over a
+    process pool, prints each result as it streams back and finishes with a
+    summary table.'''
+    parser = argparse.ArgumentParser(description="Play headless Doodle Jump games " \
+                                     "for bot policies on every core.")
+    parser.add_argument("--policies", nargs="+", default=["climber"], \
+                        choices=sorted(POLICIES))
+    parser.add_argument("--seeds", default="0-99", help='eg. "0-99" or "1,5,9"')
+    parser.add_argument("--max-frames", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=None, \
+                        help="worker processes (default: one per core)")
+    parser.add_argument("--chunk", type=int, default=8, \
+                        help="seeds handed to a worker at a time")
+    parser.add_argument("--csv", help="also write every result to this file")
+    parser.add_argument("--quiet", action="store_true", \
+                        help="only print the summary table")
+    options = parser.parse_args(arguments)
+
+    seeds = parseSeeds(options.seeds)
+    results = []
+    startTime = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=options.workers) as executor:
+        futures = []
+        for policyName in options.policies:
+            for index in range(0, len(seeds), options.chunk):
+                futures.append(executor.submit(playEpisodes, policyName, \
+                               seeds[index:index + options.chunk], options.max_frames))
+        for future in as_completed(futures):
+            for result in future.result():
+                results.append(result)
+                if not options.quiet:
+                    print("%-10s seed %6d  score %7d  frames %7d  %s" % (result["policy"], \
+                          result["seed"], result["score"], result["frames"], \
+                          result["cause"]))
+    elapsed = time.perf_counter() - startTime
+
+    print("")
+    for line in summarize(results, options.policies):
+        print(line)
+    totalFrames = sum(result["frames"] for result in results)
+    print("%d episodes, %d frames in %.1f s (%.0f frames/s)" % (len(results), \
+          totalFrames, elapsed, totalFrames / max(elapsed, 1e-9)))
+
+    if options.csv:
+        with open(options.csv, "w") as csvFile:
+            csvFile.write("policy,seed,score,frames,cause,seconds\n")
+            for result in sorted(results, key=lambda result: (result["policy"], \
+                                                                result["seed"])):
+                csvFile.write("%s,%d,%d,%d,%s,%.4f\n" % (result["policy"], \
+                              result["seed"], result["score"], result["frames"], \
+                              result["cause"], result["seconds"]))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())